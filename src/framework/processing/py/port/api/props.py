@@ -1,7 +1,71 @@
 from dataclasses import dataclass
 from typing import Optional, TypedDict
 
-import pandas as pd
+import numpy as np
+
+from port.api.table import Table
+
+# display format of the dates in the consent form
+date_format = "%d-%m-%Y"
+
+
+def format_dates(data_frame):
+    """
+    returns the table (Table or pandas DataFrame) with its date columns (datetime64)
+    formatted for display, each distinct day is formatted once
+    """
+
+    if isinstance(data_frame, Table):
+        return _format_table_dates(data_frame)
+
+    import pandas as pd
+
+    date_columns = [
+        column
+        for column in data_frame.columns
+        if pd.api.types.is_datetime64_any_dtype(data_frame[column])
+    ]
+    if not date_columns:
+        return data_frame
+
+    data_frame = data_frame.copy()
+    for column in date_columns:
+        codes, days = pd.factorize(data_frame[column])
+        # code -1 (missing date) takes the last label
+        labels = np.append(days.strftime(date_format).to_numpy(dtype=object), None)
+        data_frame[column] = labels[codes]
+
+    return data_frame
+
+
+def _format_table_dates(table):
+    date_titles = [
+        title
+        for title, column in table.columns.items()
+        if isinstance(column, np.ndarray) and column.dtype.kind == "M"
+    ]
+    if not date_titles:
+        return table
+
+    columns = dict(table.columns)
+    for title in date_titles:
+        days, codes = np.unique(columns[title], return_inverse=True)
+        labels = np.array(
+            [
+                (
+                    None
+                    if np.isnat(day)
+                    else day.astype("datetime64[us]")
+                    .astype(object)
+                    .strftime(date_format)
+                )
+                for day in days
+            ],
+            dtype=object,
+        )
+        columns[title] = labels[codes]
+
+    return Table(columns)
 
 
 class Translations(TypedDict):
@@ -95,19 +159,22 @@ class PropsUIPromptConsentFormTable:
     Attributes:
         id: a unique string to itentify the table after donation
         title: title of the table
-        data_frame: table to be shown
+        data_frame: table to be shown (Table, or a pandas DataFrame)
+        pending: the table is still being extracted, a placeholder is shown instead
     """
 
     id: str
     title: Translatable
-    data_frame: pd.DataFrame
+    data_frame: Table
+    pending: bool = False
 
     def toDict(self):
         dict = {}
         dict["__type__"] = "PropsUIPromptConsentFormTable"
         dict["id"] = self.id
         dict["title"] = self.title.toDict()
-        dict["data_frame"] = self.data_frame.to_json()
+        dict["data_frame"] = format_dates(self.data_frame).to_json()
+        dict["pending"] = self.pending
         return dict
 
 
@@ -118,6 +185,8 @@ class PropsUIPromptConsentForm:
     Attributes:
         tables: a list of tables
         meta_tables: a list of optional tables, for example for logging data
+        complete: False while tables are still being extracted, the form is rendered
+            again with more tables and cannot be submitted yet
     """
 
     tables: list[PropsUIPromptConsentFormTable]
@@ -125,6 +194,7 @@ class PropsUIPromptConsentForm:
     description: Optional[Translatable] = None
     donate_question: Optional[Translatable] = None
     donate_button: Optional[Translatable] = None
+    complete: bool = True
 
     def translate_tables(self):
         output = []
@@ -146,6 +216,7 @@ class PropsUIPromptConsentForm:
         dict["description"] = self.description and self.description.toDict()
         dict["donateQuestion"] = self.donate_question and self.donate_question.toDict()
         dict["donateButton"] = self.donate_button and self.donate_button.toDict()
+        dict["complete"] = self.complete
         return dict
 
 
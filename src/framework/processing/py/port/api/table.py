@@ -0,0 +1,172 @@
+import json
+from dataclasses import dataclass
+
+import numpy as np
+
+############################
+# Tables of the consent form, without pandas
+############################
+
+
+@dataclass
+class DictionaryColumn:
+    """Strings stored as small integer codes into the list of the distinct strings
+
+    Attributes:
+        codes: position in labels of the value of every row
+        labels: the distinct strings
+    """
+
+    codes: np.ndarray
+    labels: list
+
+    @classmethod
+    def encode(cls, values, label=str):
+        """encodes the values, label turns each distinct value into its string once"""
+        distinct = {}
+        codes = np.fromiter(
+            (distinct.setdefault(value, len(distinct)) for value in values),
+            dtype=np.int32,
+        )
+        return cls(codes, [label(value) for value in distinct])
+
+    @classmethod
+    def from_flags(cls, flags, no, yes):
+        """a bool array shown as the strings no and yes"""
+        return cls(np.asarray(flags, dtype=bool).astype(np.int8), [no, yes])
+
+    def __len__(self):
+        return len(self.codes)
+
+    def decode(self):
+        return np.array(self.labels, dtype=object)[self.codes]
+
+
+def _column(values):
+    if isinstance(values, (np.ndarray, DictionaryColumn)):
+        return values
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _json_value(value):
+    # like pandas: missing values are null, floats have 10 decimals
+    if isinstance(value, float):
+        return None if value != value else round(value, 10)
+    return value
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class Table:
+    """Table of equally long columns by title, as shown in the consent form
+
+    Columns are numpy arrays (days are datetime64[D]), DictionaryColumns
+    or lists (stored as object arrays). Serializes like a pandas DataFrame,
+    which it replaces so pandas does not have to be loaded.
+
+    Attributes:
+        columns: column by title, in display order
+    """
+
+    def __init__(self, columns=None):
+        columns = dict(columns or {})
+
+        # scalars are repeated for every row, like in a DataFrame
+        lengths = {
+            len(values)
+            for values in columns.values()
+            if isinstance(values, (list, tuple, np.ndarray, DictionaryColumn))
+        }
+        if len(lengths) > 1:
+            raise ValueError("All arrays must be of the same length")
+        if columns and not lengths:
+            raise ValueError("If using all scalar values, you must pass an index")
+        length = lengths.pop() if lengths else 0
+
+        self.columns = {
+            title: (
+                _column(values)
+                if isinstance(values, (list, tuple, np.ndarray, DictionaryColumn))
+                else _column([values] * length)
+            )
+            for title, values in columns.items()
+        }
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    @property
+    def titles(self):
+        return list(self.columns)
+
+    def values(self, title):
+        """values of a column (DictionaryColumns decoded)"""
+        column = self.columns[title]
+        if isinstance(column, DictionaryColumn):
+            return column.decode()
+        return column
+
+    def row(self, index):
+        """values of a row by title"""
+        return {title: self.values(title)[index] for title in self.columns}
+
+    def group_list(self, by, title):
+        """
+        table of the distinct values of column by (sorted) and the list of the values
+        of column title in their rows, like DataFrame.groupby(by)[title].agg(list)
+        """
+
+        keys, inverse = np.unique(self.values(by), return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        starts = np.searchsorted(inverse[order], np.arange(len(keys)))
+        values = self.values(title)[order].tolist()
+
+        groups = np.empty(len(keys), dtype=object)
+        groups[:] = [
+            values[start:end] for start, end in zip(starts, [*starts[1:], len(order)])
+        ]
+        return Table({by: keys, title: groups})
+
+    def to_json(self):
+        """JSON like pandas DataFrame.to_json(): {title: {row: value}}"""
+
+        data = {}
+        for title in self.columns:
+            column = self.values(title)
+            if column.dtype.kind == "M":
+                # dates are milliseconds since the epoch
+                missing = np.isnat(column)
+                column = column.astype("datetime64[ms]").astype(np.int64).astype(object)
+                column[missing] = None
+            values = column.tolist()
+            if column.dtype.kind in "fO":
+                values = [_json_value(value) for value in values]
+            data[str(title)] = dict(zip(map(str, range(len(values))), values))
+
+        serialized = json.dumps(
+            data, ensure_ascii=True, separators=(",", ":"), default=_json_default
+        )
+
+        # pandas escapes slashes, which only occur in strings
+        return serialized.replace("/", "\\/")
+
+    def to_data_frame(self):
+        """pandas DataFrame of the table, for studies that need pandas"""
+        import pandas as pd
+
+        return pd.DataFrame({title: self.values(title) for title in self.columns})
+
+
+def as_table(extracted):
+    """Table of an extraction result, which is a Table or (if a study uses pandas) a DataFrame"""
+    if isinstance(extracted, Table):
+        return extracted
+    return Table({title: extracted[title].to_numpy() for title in extracted.columns})
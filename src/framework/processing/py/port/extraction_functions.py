@@ -1,7 +1,8 @@
 from port.api.assets import *
 from port.api.props import Translatable
-import pandas as pd
-from datetime import datetime, timezone, timedelta
+from port.api.table import DictionaryColumn, Table
+import numpy as np
+from datetime import date, datetime, timedelta
 import re
 
 ############################
@@ -9,28 +10,236 @@ import re
 ############################
 
 
+# days are counted from 1970-01-01, in UTC +1
+_EPOCH_DAY = date(1970, 1, 1)
+_UTC_OFFSET = 3600
+_DAY = 86400
+
+# fake date if unable to convert
+_FALLBACK_DAY = (date(1999, 1, 1) - _EPOCH_DAY).days
+
+# range of pandas datetimes (1677-09-22 to 2262-04-11)
+_MIN_SECONDS = (date(1677, 9, 22) - _EPOCH_DAY).days * _DAY - _UTC_OFFSET
+_MAX_SECONDS = ((date(2262, 4, 11) - _EPOCH_DAY).days + 1) * _DAY - _UTC_OFFSET - 1
+
+
+def _as_column(epoch_timestamps):
+    """1-d array of the timestamps, values that are not scalars (like lists) are kept as objects"""
+
+    try:
+        values = np.asarray(epoch_timestamps)
+        if values.ndim == 1:
+            return values
+    except ValueError:
+        pass
+
+    values = np.empty(len(epoch_timestamps), dtype=object)
+    for i, value in enumerate(epoch_timestamps):
+        values[i] = value
+    return values
+
+
+def _epochs_to_seconds(epoch_timestamps):
+    """int64 seconds of the timestamps (converted like int()) and a mask of the convertible ones"""
+
+    values = _as_column(epoch_timestamps)
+
+    if values.dtype.kind in "iub":
+        seconds = values.astype(np.int64)
+        return seconds, np.ones(len(seconds), dtype=bool)
+
+    if values.dtype.kind == "f":
+        valid = np.isfinite(values) & (np.abs(values) < 2**62)
+        seconds = np.trunc(np.where(valid, values, 0)).astype(np.int64)
+        return seconds, valid
+
+    if values.dtype.kind == "U":
+        try:
+            seconds = values.astype(np.int64)
+            return seconds, np.ones(len(seconds), dtype=bool)
+        except (ValueError, OverflowError):
+            pass
+
+    # mixed or invalid values, one by one
+    seconds = np.zeros(len(values), dtype=np.int64)
+    valid = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values.tolist()):
+        try:
+            value = int(value)
+        except:
+            continue
+        if abs(value) < 2**62:
+            seconds[i] = value
+            valid[i] = True
+
+    return seconds, valid
+
+
+def epochs_to_days(epoch_timestamps):
+    """
+    Convert epoch timestamps to day numbers (days since 1970-01-01), assumes UTC +1
+
+    Timestamps that cannot be converted get the fake date 01-01-1999
+    """
+
+    if len(epoch_timestamps) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    seconds, valid = _epochs_to_seconds(epoch_timestamps)
+    valid &= (seconds >= _MIN_SECONDS) & (seconds <= _MAX_SECONDS)
+
+    days = np.floor_divide(np.where(valid, seconds, 0) + _UTC_OFFSET, _DAY)
+    return np.where(valid, days, _FALLBACK_DAY)
+
+
+def format_days(days, date_format="%d-%m-%Y"):
+    """day numbers to strings for display in browser, formatting each distinct day once"""
+
+    if len(days) == 0:
+        return []
+
+    unique_days, inverse = np.unique(days, return_inverse=True)
+    labels = np.array(
+        [
+            (_EPOCH_DAY + timedelta(days=int(day))).strftime(date_format)
+            for day in unique_days
+        ],
+        dtype=object,
+    )
+    return labels[inverse].tolist()
+
+
+def epochs_to_dates(epoch_timestamps):
+    """Convert epoch timestamps to "%d-%m-%Y" strings, assumes UTC +1 (see epochs_to_days)"""
+    return format_days(epochs_to_days(epoch_timestamps))
+
+
+def epochs_to_datetimes(epoch_timestamps):
+    """
+    Convert epoch timestamps to days (datetime64[D]), assumes UTC +1 (see epochs_to_days)
+
+    Days group and sort chronologically and are only formatted for display
+    when the consent form table is built (see port.api.props.format_dates)
+    """
+    return epochs_to_days(epoch_timestamps).astype("datetime64[D]")
+
+
+def _days_and_counts(days):
+    """distinct days in chronological order and how often each occurs"""
+
+    if len(days) == 0:
+        return days, np.zeros(0, dtype=np.int64)
+
+    # Exports are mostly time ordered (newest first): count the runs of equal days
+    steps = np.diff(days)
+    if (steps >= 0).all() or (steps <= 0).all():
+        if len(days) > 1 and days[0] > days[-1]:
+            days = days[::-1]
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        return days[starts], np.diff(np.r_[starts, len(days)])
+
+    # bin by day number if the days span not much more than there are timestamps
+    first = days.min()
+    span = days.max() - first + 1
+    if span <= 4 * len(days) + 1024:
+        counts = np.bincount(days - first, minlength=span)
+        present = np.flatnonzero(counts)
+        return present + first, counts[present]
+
+    return np.unique(days, return_counts=True)
+
+
+def count_per_day(epoch_timestamps, tl_date, tl_value):
+    """
+    Count the epoch timestamps per day, assumes UTC +1 (see epochs_to_days)
+
+    Returns a table with the days (chronological) under tl_date and the counts under tl_value
+    """
+
+    days, counts = _days_and_counts(epochs_to_days(epoch_timestamps))
+    return Table(
+        {tl_date: days.astype("datetime64[D]"), tl_value: counts.astype(np.int64)}
+    )
+
+
+# shred media records (posts, stories) into columns
+def shred_media(media, picture_info, locale):
+    """
+    Walk the media records once and fill typed columns: the creation days,
+    whether the photo has location data and whether a face is visible in it
+    (picture_info by uri, see check_faces_in_zip)
+    """
+
+    tl_value = translate(
+        {
+            "en": ["Date", "Liked location", "Face visible"],
+            "de": ["Datum", "Verlikter Standort", "Gesicht sichtbar"],
+            "nl": ["Datum", "Locatie leuk gevonden", "Zichtbaar gezicht"],
+        },
+        locale,
+    )
+
+    timestamps = []
+    has_latitude_data = []
+    face_visible = []
+
+    for item in media:
+        timestamps.append(item.get("creation_timestamp", ""))
+        has_latitude_data.append(
+            any(
+                "latitude" in exif_data
+                for exif_data in item.get("media_metadata", {})
+                .get("photo_metadata", {})
+                .get("exif_data", [])
+            )
+        )
+
+        # check if the URI is in the picture_info dictionary
+        face_visible.append(picture_info.get(item.get("uri", ""), False))
+
+    # no records: no columns either, like a DataFrame of no rows
+    if not timestamps:
+        return Table()
+
+    return Table(
+        {
+            tl_value[0]: epochs_to_datetimes(timestamps),  # convert epochs to dates
+            tl_value[1]: DictionaryColumn.from_flags(
+                has_latitude_data,
+                translate("dummy", locale, False),
+                translate("dummy", locale, True),
+            ),
+            tl_value[2]: DictionaryColumn.encode(
+                face_visible, lambda value: translate("dummy", locale, value)
+            ),
+        }
+    )
+
+
 # convert timespamp
 def epoch_to_date(epoch_timestamp: str | int) -> str:
     """
-    Convert epoch timestamp to an ISO 8601 string. Assumes UTC +1
+    Convert epoch timestamp to a "%d-%m-%Y" string. Assumes UTC +1
 
-    If timestamp cannot be converted raise CannotConvertEpochTimestamp
+    If timestamp cannot be converted the fake date 01-01-1999 is used,
+    use epochs_to_dates to convert many timestamps at once
     """
 
-    try:
-        epoch_timestamp = int(epoch_timestamp)
-        out = datetime.fromtimestamp(
-            epoch_timestamp, tz=timezone(timedelta(hours=1))
-        ).isoformat()  # timezone = utc + 1
+    return epochs_to_dates([epoch_timestamp])[0]
+
 
-    except:
-        # fake date if unable to convert
-        out = "01-01-1999"
+# convert ISO 8601 timestamps
+def isos_to_dates_and_times(iso_timestamps):
+    """
+    Split ISO 8601 timestamps into dates ("%Y-%m-%d" strings) and times,
+    parsing each distinct timestamp once
+    """
 
-    out = pd.to_datetime(out)
-    return out.date().strftime(
-        "%d-%m-%Y"
-    )  # convertion to string for display in browser
+    parsed = {t: datetime.fromisoformat(t) for t in dict.fromkeys(iso_timestamps)}
+
+    dates = [str(parsed[t].date()) for t in iso_timestamps]
+    times = [parsed[t].time() for t in iso_timestamps]
+    return dates, times
 
 
 # split name at whitespace, dot, or underscore
@@ -110,118 +319,6 @@ def translate(value, locale, dummy_decider=None):
 ############################
 
 
-def extract_ads_clicked(ads_clicked_dict, locale):
-    """extract ads_information/ads_and_topics/ads_clicked -> list of product names per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {"en": "Clicked ad", "de": "Angeklickte Werbung", "nl": "Geklikte advertentie"},
-        locale,
-    )
-
-    timestamps = [
-        t["string_list_data"][0]["timestamp"]
-        for t in ads_clicked_dict["impressions_history_ads_clicked"]
-    ]  # get list with timestamps in epoch format
-    dates = [epoch_to_date(t) for t in timestamps]  # convert epochs to dates
-    products = [i["title"] for i in ads_clicked_dict["impressions_history_ads_clicked"]]
-
-    adds_clicked_df = pd.DataFrame({tl_date: dates, tl_value: products})
-
-    aggregated_df = adds_clicked_df.groupby(tl_date)[tl_value].agg(list).reset_index()
-
-    return aggregated_df
-
-
-def extract_ads_viewed(ads_viewed_dict, locale):
-    """extract ads_information/ads_and_topics/ads_viewed -> list of authors per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {"en": "Seen accounts", "de": "Gesehene Konten", "nl": "Geziene accounts"},
-        locale,
-    )
-
-    timestamps = [
-        t["string_map_data"]["Time"]["timestamp"]
-        for t in ads_viewed_dict["impressions_history_ads_seen"]
-    ]  # get list with timestamps in epoch format (if author exists)
-    dates = [epoch_to_date(t) for t in timestamps]  # convert epochs to dates
-    authors = [
-        i["string_map_data"]["Author"]["value"]
-        if "Author" in i["string_map_data"]
-        else translate(
-            {
-                "en": "Unknown account",
-                "de": "Unbekanntes Konto",
-                "nl": "Onbekend account",
-            },
-            locale,
-        )
-        for i in ads_viewed_dict["impressions_history_ads_seen"]
-    ]  # not for all viewed ads there is an author!
-
-    adds_viewed_df = pd.DataFrame({tl_date: dates, tl_value: authors})
-
-    aggregated_df = adds_viewed_df.groupby(tl_date)[tl_value].agg(list).reset_index()
-
-    return aggregated_df
-
-
-def get_postViewsPerDay(posts_viewed_dict, locale):
-    """extract ads_information/ads_and_topics/posts_viewed -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of viewed posts",
-            "de": "Anzahl der gesehenen Posts",
-            "nl": "Aantal bekeken berichten",
-        },
-        locale,
-    )
-
-    timestamps = [
-        t["string_map_data"]["Time"]["timestamp"]
-        for t in posts_viewed_dict["impressions_history_posts_seen"]
-    ]  # get list with timestamps in epoch format
-    dates = [epoch_to_date(t) for t in timestamps]  # convert epochs to dates
-    postViewedDates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = postViewedDates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def get_videoViewsPerDay(videos_watched_dict, locale):
-    """extract ads_information/ads_and_topics/videos_watched -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of viewed videos",
-            "de": "Anzahl der gesehenen Videos",
-            "nl": "Aantal bekeken video's",
-        },
-        locale,
-    )
-
-    timestamps = [
-        t["string_map_data"]["Time"]["timestamp"]
-        for t in videos_watched_dict["impressions_history_videos_watched"]
-    ]  # get list with timestamps in epoch format
-    dates = [epoch_to_date(t) for t in timestamps]  # convert epochs to dates
-    videosViewedDates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = videosViewedDates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
 def extract_subscription_for_no_ads(subscription_for_no_ads_dict, locale):
     """extract ads_information/instagram_ads_and_businesses/subscription_for_no_ads -> dummy whether user has such a subscription"""
 
@@ -241,90 +338,7 @@ def extract_subscription_for_no_ads(subscription_for_no_ads_dict, locale):
     else:
         value = translate("dummy", locale, True)
 
-    return pd.DataFrame([value], columns=[tl_value])
-
-
-def extract_blocked_accounts(blocked_accounts_dict, locale):
-    """extract connections/followers_and_following/blocked_accounts -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of blocked account",
-            "de": "Anzahl blockierter Konten",
-            "nl": "Aantal geblokkeerde accounts",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in blocked_accounts_dict["relationships_blocked_users"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_close_friends(close_friends_dict, locale):
-    """extract connections/followers_and_following/close_friends -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of close friends",
-            "de": 'Anzahl "enger Freunde"',
-            "nl": "Aantal beste vrienden",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in close_friends_dict["relationships_close_friends"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_followers_1(followers_1_dict, locale):
-    """extract connections/followers_and_following/followers_1 -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of followers",
-            "de": "Anzahl der Follower",
-            "nl": "Aantal volgers",
-        },
-        locale,
-    )
-
-    # file can just be dict and not list if only one follower
-    if isinstance(followers_1_dict, dict):
-        dates = [epoch_to_date(followers_1_dict["string_list_data"][0]["timestamp"])]
-    else:
-        dates = [
-            epoch_to_date(t["string_list_data"][0]["timestamp"])
-            for t in followers_1_dict
-        ]
-
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
+    return Table({tl_value: [value]})
 
 
 def extract_following(following_dict, locale):
@@ -347,165 +361,7 @@ def extract_following(following_dict, locale):
         ]  # get count of following
         count = len(following)
 
-    return pd.DataFrame([count], columns=[tl_value])
-
-
-def extract_follow_requests_youve_received(follow_requests_youve_received_dict, locale):
-    """extract connections/followers_and_following/follow_requests_you've_received_dict -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of received follow requests",
-            "de": "Anzahl der Followeranfragen",
-            "nl": "Aantal ontvangen volgverzoeken",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in follow_requests_youve_received_dict[
-            "relationships_follow_requests_received"
-        ]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_hide_story_from(hide_story_from_dict, locale):
-    """extract connections/followers_and_following/hide_story_from -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of hidden stories",
-            "de": "Anzahl der versteckten Stories",
-            "nl": "Aantal verborgen verhalen",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in hide_story_from_dict["relationships_hide_stories_from"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_pending_follow_requests(pending_follow_requests_dict, locale):
-    """extract connections/followers_and_following/pending_follow_requests -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of pending follow requests",
-            "de": "Anzahl ignorierter Followeranfragen",
-            "nl": "Aantal wachtende volggrequests",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in pending_follow_requests_dict["relationships_follow_requests_sent"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_recently_unfollowed_accounts(recently_unfollowed_accounts_dict, locale):
-    """extract connections/followers_and_following/recently_unfollowed_accounts -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of recently unfollowed accounts",
-            "de": "Anzahl der entfolgten Konten",
-            "nl": "Aantal recent ontvolgde accounts",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in recently_unfollowed_accounts_dict["relationships_unfollowed_users"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_removed_suggestions(removed_suggestions_dict, locale):
-    """extract connections/followers_and_following/removed_suggestions -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of removed suggestions",
-            "de": "Anzahl der entfernten Vorschläge",
-            "nl": "Aantal verwijderde suggesties",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in removed_suggestions_dict["relationships_dismissed_suggested_users"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_restricted_accounts(restricted_accounts_dict, locale):
-    """extract connections/followers_and_following/restricted_accounts -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of restricted accounts",
-            "de": "Anzahl der eingeschränkten Konten",
-            "nl": "Aantal beperkte accounts",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in restricted_accounts_dict["relationships_restricted_users"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
+    return Table({tl_value: [count]})
 
 
 def extract_notification_of_privacy_policy_updates(
@@ -542,7 +398,7 @@ def extract_notification_of_privacy_policy_updates(
         ]
     ]
 
-    result = pd.DataFrame({tl_date: dates, tl_value: consent_statuses})
+    result = Table({tl_date: dates, tl_value: consent_statuses})
 
     return result
 
@@ -577,7 +433,7 @@ def extract_account_information(account_information_dict, locale):
             ][k]["value"]
             break
 
-    return pd.DataFrame([translate("dummy", locale, value)], columns=[tl_value])
+    return Table({tl_value: [translate("dummy", locale, value)]})
 
 
 def extract_linked_meta_accounts(linked_meta_accounts_dict, locale):
@@ -603,7 +459,7 @@ def extract_linked_meta_accounts(linked_meta_accounts_dict, locale):
     if not accounts:
         accounts = tl_value2
 
-    accounts_df = pd.DataFrame({tl_value1: accounts})
+    accounts_df = Table({tl_value1: accounts})
 
     return accounts_df
 
@@ -700,7 +556,7 @@ def extract_personal_information(personal_information_dict, locale):
     # check if name in list of names
     real_name = check_name(names_to_check)
 
-    result = pd.DataFrame(
+    result = Table(
         {
             tl_value[0]: [translate("dummy", locale, profile_image)],
             tl_value[1]: [translate("dummy", locale, email)],
@@ -739,10 +595,10 @@ def extract_profile_changes(profile_changes_dict, locale):
 
     for k in ["Change Date", "Datum \u00c3\u00a4ndern"]:  # keys are language specific
         if any(k in d for d in changes):
-            changed_dates = [epoch_to_date(t[k]["timestamp"]) for t in changes]
+            changed_dates = epochs_to_datetimes([t[k]["timestamp"] for t in changes])
             break
 
-    changes_df = pd.DataFrame({tl_date: changed_dates, tl_value: changed_values})
+    changes_df = Table({tl_date: changed_dates, tl_value: changed_values})
 
     return changes_df
 
@@ -771,7 +627,7 @@ def extract_comments_allowed_from(comments_allowed_from_dict, locale):
             ][k]["value"]
             break
 
-    return pd.DataFrame([value], columns=[tl_value])
+    return Table({tl_value: [value]})
 
 
 def extract_comments_blocked_from(comments_blocked_from_dict, locale):
@@ -793,7 +649,7 @@ def extract_comments_blocked_from(comments_blocked_from_dict, locale):
             [f for f in comments_blocked_from_dict["settings_blocked_commenters"]]
         )
 
-    return pd.DataFrame([count], columns=[tl_value])
+    return Table({tl_value: [count]})
 
 
 def extract_consents(consents_dict, locale):
@@ -806,7 +662,7 @@ def extract_consents(consents_dict, locale):
 
     consents = [v["label"] for v in consents_dict["label_values"]]
 
-    result = pd.DataFrame({tl_date: date, tl_value: consents})
+    result = Table({tl_date: date, tl_value: consents})
 
     return result
 
@@ -832,7 +688,7 @@ def extract_use_crossapp_messaging(use_cross_app_messaging_dict, locale):
             if k in a["string_map_data"]:
                 enabled = a["string_map_data"][k]["value"]
 
-    return pd.DataFrame([translate("dummy", locale, enabled)], columns=[tl_value])
+    return Table({tl_value: [translate("dummy", locale, enabled)]})
 
 
 def extract_topics_df(topics_dict, locale):
@@ -844,7 +700,7 @@ def extract_topics_df(topics_dict, locale):
     topics_list = [
         t["string_map_data"]["Name"]["value"] for t in topics_dict["topics_your_topics"]
     ]
-    topics_df = pd.DataFrame(topics_list, columns=[tl_value])
+    topics_df = Table({tl_value: topics_list})
 
     return topics_df
 
@@ -869,12 +725,14 @@ def extract_account_privacy_changes(account_privacy_changes_dict, locale):
         for k in ["Time", "Zeit"]:  # keys are language specific
             if k in c["string_map_data"]:
                 timestamp = c["string_map_data"][k]["timestamp"]
-                timestamps.append(epoch_to_date(timestamp))
+                timestamps.append(timestamp)
                 break
 
-    changes_df = pd.DataFrame({tl_date: timestamps, tl_value: titles})
+    timestamps = epochs_to_datetimes(timestamps)  # convert epochs to dates
 
-    aggregated_df = changes_df.groupby(tl_date)[tl_value].agg(list).reset_index()
+    changes_df = Table({tl_date: timestamps, tl_value: titles})
+
+    aggregated_df = changes_df.group_list(tl_date, tl_value)
 
     return aggregated_df
 
@@ -891,12 +749,11 @@ def extract_login_activity(login_activity_dict, locale):
     logins = login_activity_dict["account_history_login_history"]
 
     timestamps = [t["title"] for t in logins]
-    dates = [str(datetime.fromisoformat(timestamp).date()) for timestamp in timestamps]
-    times = [datetime.fromisoformat(timestamp).time() for timestamp in timestamps]
+    dates, times = isos_to_dates_and_times(timestamps)
 
     user_agents = [t["string_map_data"]["User Agent"]["value"] for t in logins]
 
-    login_df = pd.DataFrame({tl_date: dates, tl_value1: times, tl_value2: user_agents})
+    login_df = Table({tl_date: dates, tl_value1: times, tl_value2: user_agents})
 
     return login_df
 
@@ -913,12 +770,11 @@ def extract_logout_activity(logout_activity_dict, locale):
     logouts = logout_activity_dict["account_history_logout_history"]
 
     timestamps = [t["title"] for t in logouts]
-    dates = [str(datetime.fromisoformat(timestamp).date()) for timestamp in timestamps]
-    times = [datetime.fromisoformat(timestamp).time() for timestamp in timestamps]
+    dates, times = isos_to_dates_and_times(timestamps)
 
     user_agents = [t["string_map_data"]["User Agent"]["value"] for t in logouts]
 
-    logout_df = pd.DataFrame({tl_date: dates, tl_value1: times, tl_value2: user_agents})
+    logout_df = Table({tl_date: dates, tl_value1: times, tl_value2: user_agents})
 
     return logout_df
 
@@ -956,7 +812,7 @@ def extract_signup_information(signup_information_dict, locale):
     # check if name in list of names
     real_name = check_name(names_to_check)
 
-    return pd.DataFrame([translate("dummy", locale, real_name)], columns=[tl_value])
+    return Table({tl_value: [translate("dummy", locale, real_name)]})
 
 
 def extract_recently_viewed_items(recently_viewed_items_dict, locale):
@@ -974,174 +830,33 @@ def extract_recently_viewed_items(recently_viewed_items_dict, locale):
     items = recently_viewed_items_dict["checkout_saved_recently_viewed_products"]
     products = [p["string_map_data"]["Product Name"]["value"] for p in items]
 
-    products_df = pd.DataFrame(products, columns=[tl_value])
+    products_df = Table({tl_value: products})
 
     return products_df
 
 
-def extract_post_comments_1(post_comments_1_dict, locale):
-    """extract your_instagram_activity/comments/post_comments_1 -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of post comments",
-            "de": "Anzahl der Post-Kommentare",
-            "nl": "Aantal reacties op berichten",
-        },
-        locale,
-    )
-
-    # file can just be dict and not list if only one posted comment
-    if isinstance(post_comments_1_dict, dict):
-        dates = [
-            epoch_to_date(post_comments_1_dict["string_map_data"]["Time"]["timestamp"])
-        ]
-    else:
-        dates = [
-            epoch_to_date(t["string_map_data"]["Time"]["timestamp"])
-            for t in post_comments_1_dict
-        ]  # get list with timestamps in epoch format
-
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_reels_comments(reels_comments_dict, locale):
-    """extract your_instagram_activity/comments/reels_comments -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of reel comments",
-            "de": "Anzahl der Reel-Kommentare",
-            "nl": "Aantal reacties op reels",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_map_data"]["Time"]["timestamp"])
-        for t in reels_comments_dict["comments_reels_comments"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
 def extract_archived_posts(archived_posts_dict, picture_info, locale):
     """extract your_instagram_activity/content/archived_posts -> count per day + info about face and location"""
 
-    tl_value = translate(
-        {
-            "en": ["Date", "Liked location", "Face visible"],
-            "de": ["Datum", "Verlikter Standort", "Gesicht sichtbar"],
-            "nl": ["Datum", "Locatie leuk gevonden", "Zichtbaar gezicht"],
-        },
-        locale,
+    media = (
+        media
+        for post in archived_posts_dict.get("ig_archived_post_media", [])
+        for media in post.get("media", [])
     )
 
-    results = []
-
-    for post in archived_posts_dict.get("ig_archived_post_media", []):
-        for media in post.get("media", []):
-            date = epoch_to_date(media.get("creation_timestamp", ""))
-            uri = media.get("uri", "")
-            has_latitude_data = any(
-                "latitude" in exif_data
-                for exif_data in media.get("media_metadata", {})
-                .get("photo_metadata", {})
-                .get("exif_data", [])
-            )
-
-            # check if the URI is in the picture_info dictionary
-            face_visible = picture_info.get(uri, False)
-
-            results.append(
-                {
-                    tl_value[0]: date,
-                    tl_value[1]: translate("dummy", locale, has_latitude_data),
-                    tl_value[2]: translate("dummy", locale, face_visible),
-                }
-            )
-
-    archived_posts_df = pd.DataFrame(results)
-
-    return archived_posts_df
+    return shred_media(media, picture_info, locale)
 
 
 def extract_posts_1(posts_1_dict, picture_info, locale):
     """extract your_instagram_activity/content/posts_1 -> count per day + info about face and location"""
 
-    tl_value = translate(
-        {
-            "en": ["Date", "Liked location", "Face visible"],
-            "de": ["Datum", "Verlikter Standort", "Gesicht sichtbar"],
-            "nl": ["Datum", "Locatie leuk gevonden", "Zichtbaar gezicht"],
-        },
-        locale,
-    )
-
-    results = []
-
     # file can just be dict and not list if only one post
     if isinstance(posts_1_dict, dict):
-        for media in posts_1_dict.get("media", []):
-            date = epoch_to_date(media.get("creation_timestamp", ""))
-            uri = media.get("uri", "")
-            has_latitude_data = any(
-                "latitude" in exif_data
-                for exif_data in media.get("media_metadata", {})
-                .get("photo_metadata", {})
-                .get("exif_data", [])
-            )
+        posts_1_dict = [posts_1_dict]
 
-            # check if the URI is in the picture_info dictionary
-            face_visible = picture_info.get(uri, False)
+    media = (media for post in posts_1_dict for media in post.get("media", []))
 
-            results.append(
-                {
-                    tl_value[0]: date,
-                    tl_value[1]: translate("dummy", locale, has_latitude_data),
-                    tl_value[2]: translate("dummy", locale, face_visible),
-                }
-            )
-
-    else:
-        for post in posts_1_dict:
-            for media in post.get("media", []):
-                date = epoch_to_date(media.get("creation_timestamp", ""))
-                uri = media.get("uri", "")
-                has_latitude_data = any(
-                    "latitude" in exif_data
-                    for exif_data in media.get("media_metadata", {})
-                    .get("photo_metadata", {})
-                    .get("exif_data", [])
-                )
-
-                # check if the URI is in the picture_info dictionary
-                face_visible = picture_info.get(uri, False)
-
-                results.append(
-                    {
-                        tl_value[0]: date,
-                        tl_value[1]: translate("dummy", locale, has_latitude_data),
-                        tl_value[2]: translate("dummy", locale, face_visible),
-                    }
-                )
-
-    posts_df = pd.DataFrame(results)
-
-    return posts_df
+    return shred_media(media, picture_info, locale)
 
 
 def extract_profile_photos(profile_photos_dict, picture_info, locale):
@@ -1157,11 +872,13 @@ def extract_profile_photos(profile_photos_dict, picture_info, locale):
     # check if the URI is in the picture_info dictionary
     face_visible = picture_info.get(uri, False)
 
-    face_in_picture = True if face_visible >= 1 else False
+    # the picture was left out of the face scan (like the other picture extractors show it)
+    if face_visible == "picture_not_analyzed":
+        face_in_picture = face_visible
+    else:
+        face_in_picture = True if face_visible >= 1 else False
 
-    return pd.DataFrame(
-        [translate("dummy", locale, face_in_picture)], columns=[tl_value]
-    )
+    return Table({tl_value: [translate("dummy", locale, face_in_picture)]})
 
 
 def extract_recently_deleted_content(
@@ -1169,156 +886,19 @@ def extract_recently_deleted_content(
 ):
     """extract your_instagram_activity/content/recently_deleted_content -> count per day + info about face and location"""
 
-    tl_value = translate(
-        {
-            "en": ["Date", "Liked location", "Face visible"],
-            "de": ["Datum", "Verlikter Standort", "Gesicht sichtbar"],
-            "nl": ["Datum", "Locatie leuk gevonden", "Zichtbaar gezicht"],
-        },
-        locale,
+    media = (
+        media
+        for post in recently_deleted_content_dict.get("ig_recently_deleted_media", [])
+        for media in post.get("media", [])
     )
 
-    results = []
-
-    for post in recently_deleted_content_dict.get("ig_recently_deleted_media", []):
-        for media in post.get("media", []):
-            date = epoch_to_date(media.get("creation_timestamp", ""))
-            uri = media.get("uri", "")
-            has_latitude_data = any(
-                "latitude" in exif_data
-                for exif_data in media.get("media_metadata", {})
-                .get("photo_metadata", {})
-                .get("exif_data", [])
-            )
-
-            # Check if the URI is in the picture_info dictionary
-            face_visible = picture_info.get(uri, False)
-
-            results.append(
-                {
-                    tl_value[0]: date,
-                    tl_value[1]: translate("dummy", locale, has_latitude_data),
-                    tl_value[2]: translate("dummy", locale, face_visible),
-                }
-            )
-
-    recently_deleted_content_df = pd.DataFrame(results)
-
-    return recently_deleted_content_df
-
-
-def extract_reels(reels_dict, locale):
-    """extract your_instagram_activity/content/reels -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {"en": "Count of reels", "de": "Anzahl der Reels", "nl": "Aantal reels"}, locale
-    )
-
-    dates = [
-        epoch_to_date(media.get("creation_timestamp"))
-        for reel in reels_dict.get("ig_reels_media", [])
-        for media in reel.get("media", [])
-    ]
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
+    return shred_media(media, picture_info, locale)
 
 
 def extract_stories(stories_dict, picture_info, locale):
     """extract your_instagram_activity/content/stories -> count per day + info about face and location"""
 
-    tl_value = translate(
-        {
-            "en": ["Date", "Liked location", "Face visible"],
-            "de": ["Datum", "Verlikter Standort", "Gesicht sichtbar"],
-            "nl": ["Datum", "Locatie leuk gevonden", "Zichtbaar gezicht"],
-        },
-        locale,
-    )
-
-    results = []
-
-    for story in stories_dict.get("ig_stories", []):
-        date = epoch_to_date(story.get("creation_timestamp", ""))
-        uri = story.get("uri", "")
-        has_latitude_data = any(
-            "latitude" in exif_data
-            for exif_data in story.get("media_metadata", {})
-            .get("photo_metadata", {})
-            .get("exif_data", [])
-        )
-
-        # check if the URI is in the picture_info dictionary
-        face_visible = picture_info.get(uri, False)
-
-        results.append(
-            {
-                tl_value[0]: date,
-                tl_value[1]: translate("dummy", locale, has_latitude_data),
-                tl_value[2]: translate("dummy", locale, face_visible),
-            }
-        )
-
-    stories_df = pd.DataFrame(results)
-
-    return stories_df
-
-
-def extract_liked_comments(liked_comments_dict, locale):
-    """extract your_instagram_activity/likes/liked_comments -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of liked comments",
-            "de": 'Anzahl "geliker" Kommentare',
-            "nl": "Aantal gelikete reacties",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in liked_comments_dict["likes_comment_likes"]
-    ]
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_liked_posts(liked_posts_dict, locale):
-    """extract your_instagram_activity/likes/liked_posts -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of liked posts",
-            "de": 'Anzahl "geliker" Posts',
-            "nl": "Aantal gelikete berichten",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in liked_posts_dict["likes_media_likes"]
-    ]
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
+    return shred_media(stories_dict.get("ig_stories", []), picture_info, locale)
 
 
 def extract_saved_collections(saved_collections_dict, locale):
@@ -1341,207 +921,14 @@ def extract_saved_collections(saved_collections_dict, locale):
         for k in ["Added Time"]:  # keys are language specific
             if k in t["string_map_data"]:
                 try:
-                    dates.append(epoch_to_date(t["string_map_data"][k]["timestamp"]))
+                    dates.append(t["string_map_data"][k]["timestamp"])
                 except:
                     continue
                 break
 
     if not dates:
-        return pd.DataFrame(
-            ['Keine Informationen: (Datei "saved_collections" hat keine Beiträge)']
+        return Table(
+            {0: ['Keine Informationen: (Datei "saved_collections" hat keine Beiträge)']}
         )
 
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_saved_posts(saved_posts_dict, locale):
-    """extract your_instagram_activity/saved/saved_posts -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of saved content",
-            "de": "Anzahl gespeicherter Beiträge",
-            "nl": "Aantal opgeslagen inhoud",
-        },
-        locale,
-    )
-
-    dates = []
-
-    # get list with timestamps in epoch format
-    for t in saved_posts_dict["saved_saved_media"]:
-        for k in ["Saved on"]:  # keys are language specific
-            if k in t["string_map_data"]:
-                dates.append(epoch_to_date(t["string_map_data"][k]["timestamp"]))
-            break
-
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_countdowns(countdowns_dict, locale):
-    """extract your_instagram_activity/story_sticker_interactions/countdowns -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of reactions",
-            "de": "Anzahl der Reaktionen",
-            "nl": "Aantal reacties",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in countdowns_dict["story_activities_countdowns"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_emoji_sliders(emoji_sliders_dict, locale):
-    """extract your_instagram_activity/story_sticker_interactions/emoji_sliders -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of reactions",
-            "de": "Anzahl der Reaktionen",
-            "nl": "Aantal reacties",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in emoji_sliders_dict["story_activities_emoji_sliders"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_polls(polls_dict, locale):
-    """extract your_instagram_activity/story_sticker_interactions/polls -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of reactions",
-            "de": "Anzahl der Reaktionen",
-            "nl": "Aantal reacties",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in polls_dict["story_activities_polls"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_questions(questions_dict, locale):
-    """extract your_instagram_activity/story_sticker_interactions/questions -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of reactions",
-            "de": "Anzahl der Reaktionen",
-            "nl": "Aantal reacties",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in questions_dict["story_activities_questions"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_quizzes(quizzes_dict, locale):
-    """extract your_instagram_activity/story_sticker_interactions/quizzes -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of reactions",
-            "de": "Anzahl der Reaktionen",
-            "nl": "Aantal reacties",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in quizzes_dict["story_activities_quizzes"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
-
-
-def extract_story_likes(story_likes_dict, locale):
-    """extract your_instagram_activity/story_sticker_interactions/story_likes -> count per day"""
-
-    tl_date = translate("date", locale)
-    tl_value = translate(
-        {
-            "en": "Count of liked stories",
-            "de": 'Anzahl "gelikter" Stories',
-            "nl": "Aantal gelikete stories ",
-        },
-        locale,
-    )
-
-    dates = [
-        epoch_to_date(t["string_list_data"][0]["timestamp"])
-        for t in story_likes_dict["story_activities_story_likes"]
-    ]  # get list with timestamps in epoch format
-    dates_df = pd.DataFrame(dates, columns=[tl_date])  # convert to df
-
-    aggregated_df = dates_df.groupby([tl_date])[
-        tl_date
-    ].size()  # count number of rows per day
-
-    return aggregated_df.reset_index(name=tl_value)
+    return count_per_day(dates, tl_date, tl_value)
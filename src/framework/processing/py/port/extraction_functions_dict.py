@@ -1,11 +1,27 @@
 import port.extraction_functions as ef
+from port.extractor_specs import compile_spec
 
 # defines which extraction functions are used and what titles are displayed
 # dict-keys are names of files or paths to that file if filename in path (like in personal_information/personal_information)
+# per day counts and lists are declared as specs compiled once with compile_spec (see port/extractor_specs.py)
+# large files are streamed record by record if their spec has "stream" (see port/extractor_specs.py)
 
 extraction_dict = {
     "ads_clicked": {
-        "extraction_function": ef.extract_ads_clicked,
+        "extraction_function": compile_spec(
+            {
+                "records": "impressions_history_ads_clicked",
+                "stream": True,
+                "timestamp": "string_list_data.0.timestamp",
+                "value": {"path": "title", "default": None},
+                "aggregate": "list",
+                "title": {
+                    "en": "Clicked ad",
+                    "de": "Angeklickte Werbung",
+                    "nl": "Geklikte advertentie",
+                },
+            }
+        ),
         "title": {
             "en": "On how many ads did you click? [per day]",
             "de": "Wie oft haben Sie Werbung angeklickt? [pro Tag]",
@@ -13,7 +29,27 @@ extraction_dict = {
         },
     },
     "ads_viewed": {
-        "extraction_function": ef.extract_ads_viewed,
+        "extraction_function": compile_spec(
+            {
+                "records": "impressions_history_ads_seen",
+                "stream": True,
+                "timestamp": "string_map_data.Time.timestamp",
+                "value": {
+                    "path": "string_map_data.Author.value",
+                    "default": {
+                        "en": "Unknown account",
+                        "de": "Unbekanntes Konto",
+                        "nl": "Onbekend account",
+                    },
+                },
+                "aggregate": "list",
+                "title": {
+                    "en": "Seen accounts",
+                    "de": "Gesehene Konten",
+                    "nl": "Geziene accounts",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you see ads? [per day]",
             "de": "Wie oft haben Sie Werbung angesehen? [pro Tag]",
@@ -21,7 +57,19 @@ extraction_dict = {
         },
     },
     "posts_viewed": {
-        "extraction_function": ef.get_postViewsPerDay,
+        "extraction_function": compile_spec(
+            {
+                "records": "impressions_history_posts_seen",
+                "stream": True,
+                "timestamp": "string_map_data.Time.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of viewed posts",
+                    "de": "Anzahl der gesehenen Posts",
+                    "nl": "Aantal bekeken berichten",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you view posts? [per day]",
             "de": "Wie oft haben Sie Posts angesehen? [pro Tag]",
@@ -29,7 +77,19 @@ extraction_dict = {
         },
     },
     "videos_watched": {
-        "extraction_function": ef.get_videoViewsPerDay,
+        "extraction_function": compile_spec(
+            {
+                "records": "impressions_history_videos_watched",
+                "stream": True,
+                "timestamp": "string_map_data.Time.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of viewed videos",
+                    "de": "Anzahl der gesehenen Videos",
+                    "nl": "Aantal bekeken video's",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you watch Reels and Story videos? [per day]",
             "de": "Wie oft haben Sie Reels und Story-Videos gesehen? [pro Tag]",
@@ -45,7 +105,18 @@ extraction_dict = {
         },
     },
     "blocked_accounts": {
-        "extraction_function": ef.extract_blocked_accounts,
+        "extraction_function": compile_spec(
+            {
+                "records": "relationships_blocked_users",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of blocked account",
+                    "de": "Anzahl blockierter Konten",
+                    "nl": "Aantal geblokkeerde accounts",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you block or restrict other Instagram accounts? [per day]",
             "de": "Wie oft haben Sie andere Instagramkonten blockiert oder eingeschränkt? [pro Tag]",
@@ -53,7 +124,18 @@ extraction_dict = {
         },
     },
     "close_friends": {
-        "extraction_function": ef.extract_close_friends,
+        "extraction_function": compile_spec(
+            {
+                "records": "relationships_close_friends",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of close friends",
+                    "de": 'Anzahl "enger Freunde"',
+                    "nl": "Aantal beste vrienden",
+                },
+            }
+        ),
         "title": {
             "en": 'How often did you add followers as "close friends"? [per day]',
             "de": 'Wie oft haben Sie Follower als "enge Freunde" hinzugefügt? [pro Tag]',
@@ -61,7 +143,18 @@ extraction_dict = {
         },
     },
     "followers_1": {
-        "extraction_function": ef.extract_followers_1,
+        "extraction_function": compile_spec(
+            {
+                "records": None,
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of followers",
+                    "de": "Anzahl der Follower",
+                    "nl": "Aantal volgers",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you gain new followers? [per day]",
             "de": "Wie oft haben Sie neue Follower? [pro Tag]",
@@ -77,7 +170,18 @@ extraction_dict = {
         },
     },
     "follow_requests_you've_received": {
-        "extraction_function": ef.extract_follow_requests_youve_received,
+        "extraction_function": compile_spec(
+            {
+                "records": "relationships_follow_requests_received",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of received follow requests",
+                    "de": "Anzahl der Followeranfragen",
+                    "nl": "Aantal ontvangen volgverzoeken",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you receive follower requests? [per day]",
             "de": "Wie oft erhalten Sie Followeranfragen? [pro Tag]",
@@ -85,7 +189,18 @@ extraction_dict = {
         },
     },
     "hide_story_from": {
-        "extraction_function": ef.extract_hide_story_from,
+        "extraction_function": compile_spec(
+            {
+                "records": "relationships_hide_stories_from",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of hidden stories",
+                    "de": "Anzahl der versteckten Stories",
+                    "nl": "Aantal verborgen verhalen",
+                },
+            }
+        ),
         "title": {
             "en": "How many accounts did you hide your story from? [per day]",
             "de": "Für wie viele Konten verstecken Sie Ihre Story? [pro Tag]",
@@ -93,7 +208,18 @@ extraction_dict = {
         },
     },
     "pending_follow_requests": {
-        "extraction_function": ef.extract_pending_follow_requests,
+        "extraction_function": compile_spec(
+            {
+                "records": "relationships_follow_requests_sent",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of pending follow requests",
+                    "de": "Anzahl ignorierter Followeranfragen",
+                    "nl": "Aantal wachtende volggrequests",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you ignore follower requests? [per day]",
             "de": "Wie oft ignorieren Sie Followeranfragen? [pro Tag]",
@@ -101,7 +227,18 @@ extraction_dict = {
         },
     },
     "recently_unfollowed_accounts": {
-        "extraction_function": ef.extract_recently_unfollowed_accounts,
+        "extraction_function": compile_spec(
+            {
+                "records": "relationships_unfollowed_users",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of recently unfollowed accounts",
+                    "de": "Anzahl der entfolgten Konten",
+                    "nl": "Aantal recent ontvolgde accounts",
+                },
+            }
+        ),
         "title": {
             "en": "How many accounts did you recently stop following? [per day]",
             "de": "Wie vielen Konten folgen Sie seit Kurzem nicht mehr? [pro Tag]",
@@ -109,7 +246,18 @@ extraction_dict = {
         },
     },
     "removed_suggestions": {
-        "extraction_function": ef.extract_removed_suggestions,
+        "extraction_function": compile_spec(
+            {
+                "records": "relationships_dismissed_suggested_users",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of removed suggestions",
+                    "de": "Anzahl der entfernten Vorschläge",
+                    "nl": "Aantal verwijderde suggesties",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you remove accounts from your suggestions? [per day]",
             "de": "Wie oft haben Sie Konten aus Ihren Vorschlägen entfernt? [pro Tag]",
@@ -117,7 +265,18 @@ extraction_dict = {
         },
     },
     "restricted_accounts": {
-        "extraction_function": ef.extract_restricted_accounts,
+        "extraction_function": compile_spec(
+            {
+                "records": "relationships_restricted_users",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of restricted accounts",
+                    "de": "Anzahl der eingeschränkten Konten",
+                    "nl": "Aantal beperkte accounts",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you restrict accounts? [per day]",
             "de": "Wie oft haben Sie Konten eingeschränkt? [pro Tag]",
@@ -245,7 +404,18 @@ extraction_dict = {
         },
     },
     "post_comments_1": {
-        "extraction_function": ef.extract_post_comments_1,
+        "extraction_function": compile_spec(
+            {
+                "records": None,
+                "timestamp": "string_map_data.Time.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of post comments",
+                    "de": "Anzahl der Post-Kommentare",
+                    "nl": "Aantal reacties op berichten",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you comment on posts? [per day]",
             "de": "Wie oft haben Sie Beiträge kommentiert? [pro Tag]",
@@ -253,7 +423,18 @@ extraction_dict = {
         },
     },
     "reels_comments": {
-        "extraction_function": ef.extract_reels_comments,
+        "extraction_function": compile_spec(
+            {
+                "records": "comments_reels_comments",
+                "timestamp": "string_map_data.Time.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of reel comments",
+                    "de": "Anzahl der Reel-Kommentare",
+                    "nl": "Aantal reacties op reels",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you comment on reels? [per day]",
             "de": "Wie oft haben Sie Reels kommentiert? [pro Tag]",
@@ -297,7 +478,19 @@ extraction_dict = {
         },
     },
     "content/reels": {
-        "extraction_function": ef.extract_reels,
+        "extraction_function": compile_spec(
+            {
+                "records": "ig_reels_media.*.media",
+                "timestamp": "creation_timestamp",
+                "aggregate": "count",
+                "missing": "default",
+                "title": {
+                    "en": "Count of reels",
+                    "de": "Anzahl der Reels",
+                    "nl": "Aantal reels",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you post reels? [per day]",
             "de": "Wie oft haben Sie Reels gepostet? [pro Tag]",
@@ -314,7 +507,18 @@ extraction_dict = {
         },
     },
     "liked_comments": {
-        "extraction_function": ef.extract_liked_comments,
+        "extraction_function": compile_spec(
+            {
+                "records": "likes_comment_likes",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of liked comments",
+                    "de": 'Anzahl "geliker" Kommentare',
+                    "nl": "Aantal gelikete reacties",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you like comments? [per day]",
             "de": 'Wie oft haben Sie Kommentare "geliked"? [pro Tag]',
@@ -322,7 +526,18 @@ extraction_dict = {
         },
     },
     "liked_posts": {
-        "extraction_function": ef.extract_liked_posts,
+        "extraction_function": compile_spec(
+            {
+                "records": "likes_media_likes",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of liked posts",
+                    "de": 'Anzahl "geliker" Posts',
+                    "nl": "Aantal gelikete berichten",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you like posts? [per day]",
             "de": 'Wie oft haben Sie Beiträge "geliked"? [pro Tag]',
@@ -338,7 +553,19 @@ extraction_dict = {
         },
     },
     "saved_posts": {
-        "extraction_function": ef.extract_saved_posts,
+        "extraction_function": compile_spec(
+            {
+                "records": "saved_saved_media",
+                "timestamp": ["string_map_data.Saved on.timestamp"],
+                "aggregate": "count",
+                "missing": "skip",
+                "title": {
+                    "en": "Count of saved content",
+                    "de": "Anzahl gespeicherter Beiträge",
+                    "nl": "Aantal opgeslagen inhoud",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you save posts or reels? [per day]",
             "de": "Wie oft haben Sie Beiträge oder Reels gespeichert? [pro Tag]",
@@ -346,7 +573,18 @@ extraction_dict = {
         },
     },
     "countdowns": {
-        "extraction_function": ef.extract_countdowns,
+        "extraction_function": compile_spec(
+            {
+                "records": "story_activities_countdowns",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of reactions",
+                    "de": "Anzahl der Reaktionen",
+                    "nl": "Aantal reacties",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you react to a countdown in a story? [per day]",
             "de": "Wie oft haben Sie auf einen Countdown in einer Story reagiert? [pro Tag]",
@@ -354,7 +592,18 @@ extraction_dict = {
         },
     },
     "emoji_sliders": {
-        "extraction_function": ef.extract_emoji_sliders,
+        "extraction_function": compile_spec(
+            {
+                "records": "story_activities_emoji_sliders",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of reactions",
+                    "de": "Anzahl der Reaktionen",
+                    "nl": "Aantal reacties",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you react to an emoji slider in a story? [per day]",
             "de": "Wie oft haben Sie auf einen Emoji-Slider in einer Story reagiert? [pro Tag]",
@@ -362,7 +611,18 @@ extraction_dict = {
         },
     },
     "polls": {
-        "extraction_function": ef.extract_polls,
+        "extraction_function": compile_spec(
+            {
+                "records": "story_activities_polls",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of reactions",
+                    "de": "Anzahl der Reaktionen",
+                    "nl": "Aantal reacties",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you react to a poll in a story? [per day]",
             "de": "Wie oft haben Sie auf eine Umfrage in einer Story reagiert? [pro Tag]",
@@ -370,7 +630,18 @@ extraction_dict = {
         },
     },
     "questions": {
-        "extraction_function": ef.extract_questions,
+        "extraction_function": compile_spec(
+            {
+                "records": "story_activities_questions",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of reactions",
+                    "de": "Anzahl der Reaktionen",
+                    "nl": "Aantal reacties",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you answer a question in a story? [per day]",
             "de": "Wie oft haben Sie eine Frage in einer Story beantwortet? [pro Tag]",
@@ -378,7 +649,18 @@ extraction_dict = {
         },
     },
     "quizzes": {
-        "extraction_function": ef.extract_quizzes,
+        "extraction_function": compile_spec(
+            {
+                "records": "story_activities_quizzes",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of reactions",
+                    "de": "Anzahl der Reaktionen",
+                    "nl": "Aantal reacties",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you answer a quiz in a story? [per day]",
             "de": "Wie oft haben Sie ein Quiz in einer Story beantwortet? [pro Tag]",
@@ -386,7 +668,18 @@ extraction_dict = {
         },
     },
     "story_likes": {
-        "extraction_function": ef.extract_story_likes,
+        "extraction_function": compile_spec(
+            {
+                "records": "story_activities_story_likes",
+                "timestamp": "string_list_data.0.timestamp",
+                "aggregate": "count",
+                "title": {
+                    "en": "Count of liked stories",
+                    "de": 'Anzahl "gelikter" Stories',
+                    "nl": "Aantal gelikete stories ",
+                },
+            }
+        ),
         "title": {
             "en": "How often did you like a story? [per day]",
             "de": 'Wie oft haben Sie eine Story "geliked"? [pro Tag]',
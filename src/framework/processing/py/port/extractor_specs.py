@@ -0,0 +1,174 @@
+import operator
+
+from port.api.table import Table
+from port.extraction_functions import count_per_day, epochs_to_datetimes, translate
+
+############################
+# Declarative extractors: per day aggregations described by a spec
+#
+# A spec is a dict with
+#   "records":   dotted path of the list of records in the json file, "*" flattens a list
+#                ("ig_reels_media.*.media"), None if the file itself is the list
+#                (a file with a single dict is one record)
+#   "timestamp": dotted path of the epoch timestamp in a record, digits are list indices
+#                ("string_list_data.0.timestamp"), or a list of alternative paths for
+#                language specific keys (the first one found is used)
+#   "value":     optional {"path": ..., "default": translations or None}, the values
+#                listed per day (records without the path get the default)
+#   "aggregate": "count" (rows per day) or "list" (list of the values per day)
+#   "title":     translations of the title of the value column
+#   "missing":   what happens to records without a timestamp (or files without records):
+#                "error" (the extraction fails, default), "skip" (left out)
+#                or "default" (no records / fake date, like dict.get)
+#   "stream":    optional, True streams the file record by record and only keeps the fields
+#                of the timestamp and value paths (records has to be a key of the file)
+############################
+
+_MISSING = object()
+
+_LOOKUP_ERRORS = (KeyError, IndexError, TypeError)
+
+
+def _parts(path):
+    return [int(part) if part.isdigit() else part for part in path.split(".")]
+
+
+def _compose(outer, inner):
+    return lambda record: inner(outer(record))
+
+
+def _compile_path(path):
+    """function returning the value at a dotted path of a record, raising if it is missing"""
+    getters = [operator.itemgetter(part) for part in _parts(path)]
+
+    get = getters[0]
+    for getter in getters[1:]:
+        get = _compose(get, getter)
+    return get
+
+
+def _field_paths(paths):
+    return [paths] if isinstance(paths, str) else list(paths)
+
+
+def _compile_field(paths, missing, default=None):
+    """function returning the value of the first of the paths present in a record"""
+
+    paths = _field_paths(paths)
+    getters = [_compile_path(path) for path in paths]
+
+    # a single path fails like indexing the record by hand
+    if missing == "error" and len(getters) == 1:
+        return getters[0]
+
+    def get(record):
+        for getter in getters:
+            try:
+                return getter(record)
+            except _LOOKUP_ERRORS:
+                continue
+
+        if missing == "skip":
+            return _MISSING
+        if missing == "default":
+            return default
+        raise KeyError(paths[0])
+
+    return get
+
+
+def _compile_records(path, missing):
+    """
+    function yielding the records of a json file, without building a list of them
+    (the list under path can be a generator of a streamed file, see ZipIndex.read_json)
+    """
+
+    parts = [] if path is None else path.split(".")
+
+    def records(file_json):
+        level = [file_json]
+        for part in parts:
+            if part == "*":
+                level = [item for items in level for item in items]
+            elif missing == "default":
+                level = [items.get(part, []) for items in level]
+            else:
+                level = [items[part] for items in level]
+
+        for items in level:
+            # file can just be dict and not list if only one record
+            if isinstance(items, dict):
+                yield items
+            else:
+                yield from items
+
+    return records
+
+
+def compile_spec(spec):
+    """
+    Compile an extractor spec once into an extraction function (file_json, locale) -> Table,
+    the accessors of its paths are generated up front and run over the records in one pass,
+    keeping only the timestamps and values of the records
+    """
+
+    missing = spec.get("missing", "error")
+    aggregate = spec.get("aggregate", "count")
+
+    records = _compile_records(spec.get("records"), missing)
+    timestamp = _compile_field(spec["timestamp"], missing)
+
+    value_spec = spec.get("value")
+    if value_spec is not None:
+        value = _compile_field(value_spec["path"], "default", _MISSING)
+
+    def extract(file_json, locale):
+        tl_date = translate("date", locale)
+        tl_value = translate(spec["title"], locale)
+
+        rows = records(file_json)
+
+        # only "skip" leaves out records, the timestamp of the others is never _MISSING
+        if aggregate == "count":
+            timestamps = [t for t in map(timestamp, rows) if t is not _MISSING]
+            return count_per_day(timestamps, tl_date, tl_value)
+
+        default = value_spec.get("default")
+        if default is not None:
+            default = translate(default, locale)
+
+        timestamps = []
+        values = []
+        for row in rows:
+            t = timestamp(row)
+            if t is _MISSING:
+                continue
+            timestamps.append(t)
+            v = value(row)
+            values.append(v if v is not _MISSING else default)
+
+        dates = epochs_to_datetimes(timestamps)  # convert epochs to dates
+        values_df = Table({tl_date: dates, tl_value: values})
+
+        return values_df.group_list(tl_date, tl_value)
+
+    extract.spec = spec
+
+    # how ZipIndex.read_json streams the file, derived from the paths of the spec
+    if spec.get("stream"):
+        if spec.get("records") is None or "." in spec["records"]:
+            raise ValueError(
+                f"Only files with records under a key can be streamed: {spec}"
+            )
+
+        fields = _field_paths(spec["timestamp"])
+        if value_spec is not None:
+            fields += _field_paths(value_spec["path"])
+        extract.stream = {"records": spec["records"], "fields": fields}
+
+    return extract
+
+
+def stream_of(entry):
+    """how the file of an extraction_dict entry is streamed (see ZipIndex.read_json), None to read it at once"""
+    return getattr(entry["extraction_function"], "stream", None)
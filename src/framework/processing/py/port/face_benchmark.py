@@ -0,0 +1,121 @@
+import argparse
+import os
+import time
+
+from port.face_detectors import face_detector_names, get_face_detector
+
+############################
+# Benchmark of the face detectors on a local set of pictures
+#
+# python -m port.face_benchmark <directory> [--detectors haar,haar_fast]
+#
+# Pictures in a folder named "face" are labelled as showing a face,
+# pictures in a folder named "no_face" as not showing one, others are unlabelled.
+############################
+
+labels = {"face": True, "no_face": False}
+extensions = (".jpg", ".jpeg")
+
+
+def find_pictures(directory):
+    """returns (path, label) of all jpg files below directory, label None if unlabelled"""
+
+    pictures = []
+
+    for root, _, files in os.walk(directory):
+        label = labels.get(os.path.basename(root))
+        for file in sorted(files):
+            if file.lower().endswith(extensions):
+                pictures.append((os.path.join(root, file), label))
+
+    return pictures
+
+
+def run_detector(detector, pictures):
+    """returns the results and the latencies in seconds for all pictures"""
+
+    results = []
+    latencies = []
+
+    for path, _ in pictures:
+        with open(path, "rb") as img_file:
+            start_time = time.perf_counter()
+            results.append(detector(img_file))
+            latencies.append(time.perf_counter() - start_time)
+
+    return results, latencies
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def summarize(results, latencies, pictures, reference):
+    labelled = [
+        (result, label)
+        for result, (_, label) in zip(results, pictures)
+        if label is not None
+    ]
+    true_positives = sum(1 for result, label in labelled if result and label)
+
+    def rate(count, total):
+        return f"{count / total:.1%}" if total else "-"
+
+    return {
+        "pictures": len(results),
+        "mean ms": f"{1000 * sum(latencies) / len(latencies):.1f}",
+        "p50 ms": f"{1000 * percentile(latencies, 50):.1f}",
+        "p95 ms": f"{1000 * percentile(latencies, 95):.1f}",
+        "accuracy": rate(
+            sum(1 for result, label in labelled if result == label), len(labelled)
+        ),
+        "precision": rate(true_positives, sum(1 for result, _ in labelled if result)),
+        "recall": rate(true_positives, sum(1 for _, label in labelled if label)),
+        "agreement": rate(
+            sum(1 for a, b in zip(results, reference) if a == b), len(results)
+        ),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Latency and accuracy of the face detectors on local pictures"
+    )
+    parser.add_argument(
+        "directory", help='pictures, labelled by "face" and "no_face" folders'
+    )
+    parser.add_argument(
+        "--detectors",
+        default=",".join(face_detector_names()),
+        help="comma separated detector names, agreement is measured against the first one",
+    )
+    args = parser.parse_args(argv)
+
+    pictures = find_pictures(args.directory)
+    if not pictures:
+        parser.error(f"no jpg files in {args.directory}")
+
+    names = args.detectors.split(",")
+    try:
+        detectors = {name: get_face_detector(name) for name in names}
+    except ValueError as e:
+        parser.error(str(e))
+
+    runs = {name: run_detector(d, pictures) for name, d in detectors.items()}
+    reference = runs[names[0]][0]
+
+    rows = {
+        name: summarize(results, latencies, pictures, reference)
+        for name, (results, latencies) in runs.items()
+    }
+
+    columns = list(next(iter(rows.values())))
+    width = max(len(name) for name in names)
+    print(" ".join([" " * width] + [f"{column:>10}" for column in columns]))
+    for name, row in rows.items():
+        print(" ".join([f"{name:<{width}}"] + [f"{row[c]:>10}" for c in columns]))
+
+
+if __name__ == "__main__":
+    main()
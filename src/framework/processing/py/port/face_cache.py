@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+############################
+# Cache of face detection results, persisted between uploads
+############################
+
+# IDBFS directory mounted by py_worker.js in the browser
+browser_cache_dir = "/face-cache"
+
+# Directory of the cache in native runs, the environment variable
+# PORT_FACE_CACHE_DIR replaces it (an empty value turns the cache off)
+native_cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "port", "face-cache")
+
+# Whether a cache was saved since py_worker.js last persisted the IDBFS directory
+_unsynced = False
+
+_INDEX_FILE = "faces.json"
+
+
+class FaceCache:
+    """Face detection results of pictures by content, kept in a directory
+
+    A picture is identified by the CRC32 and size of its zip member, so the
+    results of a DDP that is uploaded again are found without decoding it.
+    Results of other detector parameters are never used.
+
+    Attributes:
+        directory: directory of the cache file
+        params: parameters of the face detection the results belong to
+        max_entries: number of results kept, the least recently used are evicted
+        entries: results by key, least recently used first
+        changed: whether entries have to be saved
+    """
+
+    def __init__(self, directory, params, max_entries=50000):
+        self.directory = directory
+        self.params = params
+        self.max_entries = max_entries
+        self.changed = False
+
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self._suffix = digest[:12]
+
+        self.entries = OrderedDict()
+        try:
+            with open(os.path.join(directory, _INDEX_FILE), "r") as file:
+                self.entries.update(json.load(file))
+        except (OSError, ValueError):
+            # no or unreadable cache, start empty
+            pass
+
+    def key(self, zip_info):
+        return f"{zip_info.CRC:08x}:{zip_info.file_size}:{self._suffix}"
+
+    def get(self, zip_info):
+        """cached result of the picture, None if unknown"""
+        return self.entries.get(self.key(zip_info))
+
+    def put(self, zip_info, result):
+        key = self.key(zip_info)
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        self.changed = True
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def save(self):
+        if not self.changed:
+            return
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, _INDEX_FILE)
+
+            # replace the file at once, an interrupted write leaves the old cache
+            with open(path + ".tmp", "w") as file:
+                json.dump(self.entries, file)
+            os.replace(path + ".tmp", path)
+            self.changed = False
+
+            global _unsynced
+            _unsynced = True
+
+        except OSError as e:
+            print(f"Face cache not saved: {e}")
+
+
+def open_face_cache(params):
+    """
+    the cache in the IDBFS directory in the browser, otherwise in the native cache directory
+    (None if it is turned off)
+    """
+
+    if os.path.isdir(browser_cache_dir):
+        return FaceCache(browser_cache_dir, params)
+
+    directory = os.environ.get("PORT_FACE_CACHE_DIR", native_cache_dir)
+    if not directory:
+        return None
+
+    return FaceCache(directory, params)
+
+
+def take_unsynced():
+    """
+    whether a cache was saved since the last call, py_worker.js then persists
+    the IDBFS directory to IndexedDB once
+    """
+
+    global _unsynced
+    unsynced, _unsynced = _unsynced, False
+    return unsynced
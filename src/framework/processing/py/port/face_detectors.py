@@ -0,0 +1,188 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Optional
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from port.api.assets import asset_path
+
+############################
+# Face detection backends used for the "Face visible" columns
+############################
+
+
+@dataclass
+class FaceDetector(ABC):
+    """Base of the face detectors: decodes a picture to a small grayscale image and checks it for faces
+
+    Attributes:
+        name: name of the detector, as selected in the study profile
+        size: the picture is scaled down to fit size x size pixels before detection
+    """
+
+    name: str
+    size: int = 200
+
+    @property
+    def params(self):
+        """everything the result depends on, results of other parameters are not comparable"""
+        return {"detector": self.name, "size": self.size, "decode": "draft"}
+
+    def prepare(self, img_file):
+        # Load the image from bytes
+        img = Image.open(img_file)
+
+        # Let the JPEG decoder scale down (1/2, 1/4 or 1/8) and decode grayscale only,
+        # so large photos are not decoded at full size just to be thrown away
+        img.draft("L", (self.size, self.size))
+
+        # Convert the image to grayscale
+        img_gray = img.convert("L")
+
+        # Resize the image to the desired size
+        img_gray.thumbnail((self.size, self.size), Image.Resampling.LANCZOS)
+
+        # Convert the image to a numpy array
+        return np.array(img_gray)
+
+    @abstractmethod
+    def detect(self, img_gray):
+        """returns True if there is a face in the grayscale image"""
+
+    def __call__(self, img_file):
+        return self.detect(self.prepare(img_file))
+
+
+@dataclass
+class CascadeDetector(FaceDetector):
+    """Face detection with an OpenCV cascade classifier (Haar or LBP features)
+
+    Attributes:
+        cascade: path of the cascade xml file
+        scale_factor: scale step between the detection windows
+        min_neighbors: number of overlapping detections needed for a face
+        min_size: minimum face size in pixels
+        coarse_scale_factor: if set, a cheap pass with this (larger) scale step runs first and only
+            collects candidate windows: with a group of min_neighbors candidates there is a face,
+            all other pictures get the full pass (a coarse pass without a face is inconclusive)
+    """
+
+    cascade: str = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+    scale_factor: float = 1.1
+    min_neighbors: int = 6
+    min_size: int = 30
+    coarse_scale_factor: Optional[float] = None
+    _classifiers: threading.local = field(
+        default_factory=threading.local, repr=False, compare=False
+    )
+
+    @property
+    def params(self):
+        return {
+            **super().params,
+            "cascade": os.path.basename(self.cascade),
+            "scaleFactor": self.scale_factor,
+            "minNeighbors": self.min_neighbors,
+            "minSize": self.min_size,
+            "coarseScaleFactor": self.coarse_scale_factor,
+            "coarseStage": "faces_only",
+        }
+
+    def classifier(self):
+        # classifiers are not thread safe, every thread loads its own one
+        if not hasattr(self._classifiers, "classifier"):
+            self._classifiers.classifier = cv2.CascadeClassifier(self.cascade)
+        return self._classifiers.classifier
+
+    def detect_with(self, img_gray, scale_factor):
+        faces = self.classifier().detectMultiScale(
+            img_gray,
+            scaleFactor=scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=(self.min_size, self.min_size),
+        )
+        return len(faces) > 0
+
+    def detect(self, img_gray):
+        # Fewer window sizes: a face found there is a face, but the coarse pass can miss
+        # faces between its window sizes, so all other pictures get the full pass
+        if self.coarse_scale_factor is not None:
+            candidates = self.classifier().detectMultiScale(
+                img_gray,
+                scaleFactor=self.coarse_scale_factor,
+                minNeighbors=0,
+                minSize=(self.min_size, self.min_size),
+            )
+
+            # grouped like detectMultiScale groups the windows of the full pass
+            if len(candidates) > 0:
+                faces, _ = cv2.groupRectangles(
+                    candidates.tolist(), self.min_neighbors, 0.2
+                )
+                if len(faces) > 0:
+                    return True
+
+        return self.detect_with(img_gray, self.scale_factor)
+
+
+# LBP cascade, not part of the opencv-python package, available if added to the assets
+lbp_cascade_asset = "lbpcascade_frontalface_improved.xml"
+
+
+def _haar():
+    return CascadeDetector("haar")
+
+
+def _haar_early():
+    # "haar", but a cheap coarse pass finds most faces without the full pass; pictures
+    # without a face take both passes, so it only pays off if most pictures show a face
+    return CascadeDetector("haar_early", coarse_scale_factor=1.3)
+
+
+def _haar_fast():
+    # smaller image and coarser scale steps: about a third of the windows of "haar"
+    return CascadeDetector(
+        "haar_fast",
+        size=160,
+        cascade=cv2.data.haarcascades + "haarcascade_frontalface_alt2.xml",
+        scale_factor=1.2,
+        min_neighbors=4,
+        min_size=24,
+    )
+
+
+def _lbp():
+    return CascadeDetector(
+        "lbp",
+        cascade=asset_path(lbp_cascade_asset),
+        scale_factor=1.1,
+        min_neighbors=4,
+    )
+
+
+def face_detector_names():
+    """names of the available detectors, the first one is the default"""
+    names = ["haar", "haar_early", "haar_fast"]
+    if os.path.exists(asset_path(lbp_cascade_asset)):
+        names.append("lbp")
+    return names
+
+
+def get_face_detector(name="haar"):
+    factories = {
+        "haar": _haar,
+        "haar_early": _haar_early,
+        "haar_fast": _haar_fast,
+        "lbp": _lbp,
+    }
+
+    if name not in face_detector_names():
+        raise ValueError(
+            f"Unknown face detector {name}, available: {face_detector_names()}"
+        )
+
+    return factories[name]()
@@ -0,0 +1,56 @@
+import threading
+
+import cv2
+import numpy as np
+
+############################
+# Perceptual hash to recognize copies of a picture
+############################
+
+
+def dhash(img_gray):
+    """
+    difference hash of a grayscale image: 64 bits telling whether each pixel of a
+    9 x 8 thumbnail is brighter than its left neighbour
+
+    Re-encoded and rescaled copies of a picture get the same hash. Pictures that only
+    look alike at 9 x 8 pixels (like plain dark pictures) may get it too, they then
+    share the result of the first one.
+    """
+
+    thumbnail = cv2.resize(img_gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = np.packbits(thumbnail[:, 1:] > thumbnail[:, :-1])
+    return int.from_bytes(bits.tobytes(), "big")
+
+
+class DuplicatePictures:
+    """Face detection results of the pictures of one scan by perceptual hash
+
+    Attributes:
+        results: result by hash of the first picture with that hash
+        lookups: number of pictures looked up
+        hits: number of pictures that were copies of an earlier one
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.lookups = 0
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """result of an earlier copy of the picture, None if it is the first one"""
+        with self._lock:
+            self.lookups += 1
+            result = self.results.get(key)
+            if result is not None:
+                self.hits += 1
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            self.results.setdefault(key, result)
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.lookups if self.lookups else 0.0
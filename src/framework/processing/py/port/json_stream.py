@@ -0,0 +1,220 @@
+import io
+import json
+import re
+
+############################
+# Streaming json reader with field projection
+############################
+
+# Large files like posts_viewed, videos_watched or ads_viewed are a single
+# object with one list of records. Instead of materialising the whole file,
+# the reader below walks the file chunk by chunk, decodes one record at a time
+# and only keeps the fields an extractor declared in its spec. The records are
+# yielded to the extractor as they are decoded, so only one record is in memory
+# at a time (the extractor keeps what it aggregates, like the timestamps).
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURE = re.compile(r'["{}\[\]]')
+_STRING_END = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+_DELIMITERS = {",", ":", "]", "}", " ", "\t", "\n", "\r"}
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Buffered reader over a text file that keeps at most one value in memory"""
+
+    def __init__(self, text_file, chunk_size):
+        self.file = text_file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """drop the consumed part of the buffer and read the next chunk, False at the end of the file"""
+        if self.eof:
+            return False
+
+        chunk = self.file.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+
+        if not chunk:
+            self.eof = True
+            return False
+
+        return True
+
+    def error(self, message):
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def peek(self):
+        """next non-whitespace character, or "" at the end of the file"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def value(self):
+        """decode the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+
+            # a number cut at the end of the buffer (like "1.5" of "1.5e3") continues in the next chunk
+            if self.buffer[end : end + 1] not in _DELIMITERS and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def skip(self):
+        """skip the next value without decoding it"""
+        if self.peek() not in "{[":
+            self.value()
+            return
+
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self.fill():
+                    raise self.error("Unterminated value")
+                continue
+
+            self.pos = match.end()
+            char = match.group()
+
+            if char == '"':
+                while (match := _STRING_END.match(self.buffer, self.pos)) is None:
+                    if not self.fill():
+                        raise self.error("Unterminated string")
+                self.pos = match.end()
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+
+def _iter_array(reader):
+    reader.expect("[")
+
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+
+    while True:
+        yield reader.value()
+
+        char = reader.peek()
+        reader.pos += 1
+        if char == "]":
+            return
+        if char != ",":
+            raise reader.error("Expecting ',' delimiter")
+
+
+def _iter_records(reader, records):
+    if records is None:
+        yield from _iter_array(reader)
+        return
+
+    reader.expect("{")
+    while reader.peek() != "}":
+        key = reader.value()
+        reader.expect(":")
+
+        if key == records:
+            yield from _iter_array(reader)
+            return
+
+        reader.skip()
+        if reader.peek() == ",":
+            reader.pos += 1
+
+    raise KeyError(records)
+
+
+def iter_records(text_file, records=None, chunk_size=64 * 1024):
+    """
+    Yield the records of a json file one by one
+
+    If records is given the file is an object and the records are the items of the list stored under that key,
+    otherwise the file itself is the list of records.
+    """
+
+    yield from _iter_records(_Reader(text_file, chunk_size), records)
+
+
+def compile_projection(fields):
+    """turn field paths like "string_list_data.0.timestamp" into tuples of keys and list indices"""
+    return [
+        tuple(int(part) if part.isdigit() else part for part in field.split("."))
+        for field in fields
+    ]
+
+
+def project(value, paths):
+    """copy of value that only contains the given paths"""
+
+    if any(len(path) == 0 for path in paths):
+        return value
+
+    heads = {}
+    for path in paths:
+        heads.setdefault(path[0], []).append(path[1:])
+
+    if isinstance(value, dict):
+        return {k: project(value[k], rest) for k, rest in heads.items() if k in value}
+
+    if isinstance(value, list):
+        # keep list positions so that index based lookups still work
+        indices = [k for k in heads if isinstance(k, int)]
+        length = min(max(indices, default=-1) + 1, len(value))
+        return [
+            project(value[i], heads[i]) if i in heads else None for i in range(length)
+        ]
+
+    return value
+
+
+def iter_projected(binary_file, records=None, fields=None, chunk_size=64 * 1024):
+    """
+    Stream a json file and yield its records one by one with only the given fields
+
+    A file that is a single record (and not a list) yields that record.
+    Raises KeyError while iterating if the file has no records key, like indexing json.load's result would.
+    """
+
+    text_file = io.TextIOWrapper(binary_file, encoding="utf-8")
+    reader = _Reader(text_file, chunk_size)
+    paths = compile_projection(fields or [])
+
+    try:
+        # file can just be a single record and not a list of records
+        if records is None and reader.peek() != "[":
+            record = reader.value()
+            yield project(record, paths) if paths else record
+            return
+
+        for record in _iter_records(reader, records):
+            yield project(record, paths) if paths else record
+
+    finally:
+        text_file.detach()
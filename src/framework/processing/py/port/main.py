@@ -19,6 +19,6 @@ class ScriptWrapper(Generator):
         raise StopIteration
 
 
-def start(sessionId, locale):
-    script = process(sessionId, locale)
+def start(sessionId, locale, profile=None):
+    script = process(sessionId, locale, profile)
     return ScriptWrapper(script)
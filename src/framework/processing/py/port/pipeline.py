@@ -0,0 +1,72 @@
+from collections import defaultdict, deque
+
+############################
+# Order of the extraction while pictures are checked for faces
+############################
+
+
+class ExtractionGraph:
+    """Which extractors can run while the pictures are still checked for faces
+
+    Extractors without "picture_info" do not depend on the face scan and can run
+    at any time, the others as soon as all pictures referenced in their json content
+    have a result.
+
+    Attributes:
+        independent: (index, file) of the files not depending on the face scan, not run yet
+        missing: pictures without a result yet, by picture dependent file
+        ready: (index, file) of the picture dependent files that can run, not run yet
+    """
+
+    def __init__(self, routes, needs):
+        """
+        routes: the files in the order of extraction_dict
+        needs: pictures (zip members) referenced by each picture dependent file
+        """
+
+        self.independent = deque()
+        self.missing = {}
+        self.ready = []
+        self._index = {}
+        self._waiting_for = defaultdict(list)
+
+        for index, file in enumerate(routes):
+            self._index[file] = index
+
+            if file not in needs:
+                self.independent.append((index, file))
+            elif not needs[file]:
+                self.ready.append((index, file))
+            else:
+                self.missing[file] = set(needs[file])
+                for member in self.missing[file]:
+                    self._waiting_for[member].append(file)
+
+    def picture_done(self, member):
+        """a picture got its result, files waiting only for it become ready"""
+        for file in self._waiting_for.pop(member, []):
+            missing = self.missing[file]
+            missing.discard(member)
+            if not missing:
+                del self.missing[file]
+                self.ready.append((self._index[file], file))
+
+    def take_ready(self):
+        ready, self.ready = self.ready, []
+        return sorted(ready)
+
+    def take_independent(self, count=None):
+        """up to count (all if None) files not depending on the face scan"""
+        if count is None:
+            count = len(self.independent)
+        return [
+            self.independent.popleft() for _ in range(min(count, len(self.independent)))
+        ]
+
+    def take_remaining(self):
+        """all files not run yet (after the face scan), in order"""
+        remaining = self.take_ready() + self.take_independent()
+        remaining += [(self._index[file], file) for file in self.missing]
+        self.missing = {}
+        self._waiting_for.clear()
+        return sorted(remaining)
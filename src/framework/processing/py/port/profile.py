@@ -0,0 +1,108 @@
+import dataclasses
+import json
+import os
+from dataclasses import dataclass, fields
+from typing import Optional
+
+from port.api.assets import asset_path, read_asset
+from port.face_detectors import face_detector_names
+from port.zip_index import MiB, DecompressionBudget
+
+############################
+# Study profile: which parts of the extraction a study uses
+############################
+
+profile_asset = "study_profile.json"
+
+
+@dataclass
+class StudyProfile:
+    """Selection of the extraction steps a study needs
+
+    Attributes:
+        extractors: keys of extraction_dict to extract, None for all of them
+        analyze_images: whether pictures are checked for faces (only if a selected extractor uses picture_info)
+        referenced_media_only: only check the pictures referenced by the selected extractors using picture_info,
+            instead of all pictures in the media folder
+        face_detector: name of the face detector (see port.face_detectors), "haar" by default
+        time_budget: seconds the extraction may take, pictures are left out of the face scan to stay within it
+            (None for no limit)
+        progressive_consent: render the consent form as soon as the first tables are extracted,
+            with placeholders for the others that are filled in as they complete
+        decompression_budget: limits of the DecompressionBudget to replace, like
+            {"max_member_size": 512, "max_total_size": 4096} (sizes in MiB), for native runs
+            with more memory than the browser (None for the defaults)
+    """
+
+    extractors: Optional[list[str]] = None
+    analyze_images: bool = True
+    referenced_media_only: bool = False
+    face_detector: str = "haar"
+    time_budget: Optional[float] = None
+    progressive_consent: bool = False
+    decompression_budget: Optional[dict] = None
+
+    @classmethod
+    def from_dict(cls, values):
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in values.items() if k in known})
+
+    def select(self, extraction_dict):
+        """entries of extraction_dict to run, in the order of extraction_dict"""
+        if self.extractors is None:
+            return dict(extraction_dict)
+
+        return {k: v for k, v in extraction_dict.items() if k in self.extractors}
+
+    def budget(self):
+        """decompression budget of an upload, the defaults with the limits of the profile"""
+        limits = {}
+        known = {f.name for f in fields(DecompressionBudget)} - {"total_read"}
+
+        for name, value in (self.decompression_budget or {}).items():
+            if name not in known:
+                print(
+                    f"Unknown decompression limit {name} (available: {sorted(known)})"
+                )
+            elif name.endswith("_size"):
+                limits[name] = int(value * MiB)
+            else:
+                limits[name] = value
+
+        return DecompressionBudget(**limits)
+
+    def needs_face_scan(self, selected):
+        return self.analyze_images and any(
+            "picture_info" in v for v in selected.values()
+        )
+
+
+def load_profile(profile=None):
+    """
+    Study profile from a StudyProfile, a dict or a json string,
+    or from the asset study_profile.json if no profile is given (all extractors if that does not exist)
+    """
+
+    if isinstance(profile, StudyProfile):
+        return _check_face_detector(profile)
+
+    if profile is None:
+        if not os.path.exists(asset_path(profile_asset)):
+            return StudyProfile()
+        profile = read_asset(profile_asset)
+
+    if isinstance(profile, str):
+        profile = json.loads(profile)
+
+    return _check_face_detector(StudyProfile.from_dict(profile))
+
+
+def _check_face_detector(profile):
+    # a typo in the profile should not stop the extraction, the default detector is used instead
+    available = face_detector_names()
+    if profile.face_detector not in available:
+        print(
+            f"Unknown face detector {profile.face_detector}, using {available[0]} (available: {available})"
+        )
+        profile = dataclasses.replace(profile, face_detector=available[0])
+    return profile
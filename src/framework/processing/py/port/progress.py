@@ -0,0 +1,41 @@
+import time
+
+############################
+# Progress updates sent to the UI
+############################
+
+
+def coalesce_progress(updates, max_per_second=4, min_step=None, clock=time.monotonic):
+    """
+    yields a subset of the (message, percentage, ...) updates, so the UI is not
+    rendered for every single step of the work
+
+    An update is passed on if at least 1 / max_per_second seconds passed since the last one
+    and, if min_step is given, its percentage differs by at least min_step from the last one.
+    The updates in between are consumed (the work goes on) and the last update is always passed on.
+    """
+
+    interval = 1 / max_per_second if max_per_second else 0
+    last_time = None
+    last_percentage = None
+    held = None
+
+    for update in updates:
+        percentage = update[1]
+        now = clock()
+
+        due = last_time is None or now - last_time >= interval
+        if due and min_step is not None and last_percentage is not None:
+            due = abs(percentage - last_percentage) >= min_step
+
+        if due:
+            held = None
+            last_time = now
+            last_percentage = percentage
+            yield update
+        else:
+            held = update
+
+    # The final update (like 100%) is never dropped
+    if held is not None:
+        yield held
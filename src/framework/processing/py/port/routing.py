@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+
+############################
+# Routing of extraction_dict keys to zip members
+############################
+
+
+@dataclass
+class ExtractionPlan:
+    """Zip members resolved for the keys of extraction_dict
+
+    Attributes:
+        routes: for every key (in extraction_dict order) the zip member to extract, None if missing
+        unmatched: keys without any matching member
+        ambiguous: keys with several equally specific members, with all candidates (the first one is used)
+    """
+
+    routes: dict[str, str | None]
+    unmatched: list[str] = field(default_factory=list)
+    ambiguous: dict[str, list[str]] = field(default_factory=dict)
+
+
+def _segments(path):
+    if path.endswith(".json"):
+        path = path[: -len(".json")]
+    return tuple(part for part in path.split("/") if part)
+
+
+def compile_routes(extraction_dict, members):
+    """
+    Resolve every key of extraction_dict to one json member of the zip file
+
+    A key matches a member if its path segments are the last path segments of the member
+    ("followers_and_following/following" matches ".../followers_and_following/following.json",
+    but "reels" does not match ".../reels_comments.json"). If a member matches several keys,
+    only the key with the most segments (like "content/reels" over "reels") keeps it.
+    """
+
+    # all json members by every path suffix, in the order of the zip file
+    by_suffix = {}
+    for member in members:
+        if not member.endswith(".json"):
+            continue
+        parts = _segments(member)
+        for i in range(len(parts)):
+            by_suffix.setdefault(parts[i:], []).append(member)
+
+    candidates = {key: by_suffix.get(_segments(key), []) for key in extraction_dict}
+
+    # the most specific key claims a member
+    claims = {}
+    for key, matches in candidates.items():
+        specificity = len(_segments(key))
+        for member in matches:
+            claims[member] = max(claims.get(member, 0), specificity)
+
+    plan = ExtractionPlan(routes={})
+
+    for key, matches in candidates.items():
+        specificity = len(_segments(key))
+        matches = [m for m in matches if claims[m] == specificity]
+
+        if not matches:
+            plan.unmatched.append(key)
+            plan.routes[key] = None
+            continue
+
+        if len(matches) > 1:
+            plan.ambiguous[key] = matches
+
+        plan.routes[key] = matches[0]
+
+    return plan
@@ -0,0 +1,115 @@
+import time
+from dataclasses import dataclass, field
+
+from port.zip_index import MiB
+
+############################
+# Time budget of the extraction
+############################
+
+
+@dataclass
+class TimeBudget:
+    """Wall clock time the extraction may take, shared by its phases
+
+    The json extraction is estimated from the uncompressed size of its files
+    and reserved, the face scan gets the rest and is degraded if it would overrun.
+
+    Attributes:
+        seconds: wall clock seconds for the whole extraction
+        json_seconds_per_mib: estimated seconds to extract one MiB of json
+        start: time.monotonic() when the extraction started
+        notes: what was left out to stay within the budget, for the meta data
+    """
+
+    seconds: float = 60
+    json_seconds_per_mib: float = 0.5
+    start: float = field(default_factory=time.monotonic)
+    notes: list[str] = field(default_factory=list)
+
+    def estimate_json(self, zip_index, files):
+        """estimated seconds to extract the json files"""
+        size = sum(zip_index.infos[file].file_size for file in files if file)
+        return size / MiB * self.json_seconds_per_mib
+
+    def face_schedule(self, picture_count, reserve=0):
+        """schedule of the face scan, which has to finish reserve seconds before the end of the budget"""
+        return FaceScanSchedule(self.start + self.seconds - reserve, picture_count)
+
+
+class FaceScanSchedule:
+    """Decides for every picture of the face scan whether it is analyzed
+
+    Pictures are analyzed as long as the measured time per picture lets the
+    remaining ones finish before the deadline. Otherwise only the share of the
+    remaining pictures that fits is analyzed, spread evenly, and after the deadline none.
+    Other work done in between the pictures (see other_work_done) is not counted
+    as time per picture.
+
+    Attributes:
+        deadline: time.monotonic() by which the face scan has to be finished
+        picture_count: number of pictures to decide on
+        start: time.monotonic() when the face scan started
+        planned: number of pictures decided on
+        finished: number of analyzed pictures with a result
+        sampled_out: pictures not analyzed because only a share of them fit
+        skipped: pictures not analyzed because the deadline had passed
+        other_seconds: seconds spent on other work during the face scan
+    """
+
+    def __init__(self, deadline, picture_count):
+        self.deadline = deadline
+        self.picture_count = picture_count
+        self.start = time.monotonic()
+        self.planned = 0
+        self.finished = 0
+        self.sampled_out = 0
+        self.skipped = 0
+        self.other_seconds = 0.0
+        self._credit = 0.0
+
+    def analyze(self):
+        """whether the next picture is analyzed"""
+        position = self.planned
+        self.planned += 1
+
+        now = time.monotonic()
+        time_left = self.deadline - now
+
+        if time_left <= 0:
+            self.skipped += 1
+            return False
+
+        # nothing measured yet
+        if self.finished == 0:
+            return True
+
+        seconds_per_picture = (now - self.start - self.other_seconds) / self.finished
+        projected = (self.picture_count - position) * seconds_per_picture
+
+        if projected <= time_left:
+            return True
+
+        # analyze the share that fits, spread over the remaining pictures
+        self._credit += time_left / projected
+        if self._credit >= 1:
+            self._credit -= 1
+            return True
+
+        self.sampled_out += 1
+        return False
+
+    def picture_finished(self):
+        self.finished += 1
+
+    def other_work_done(self, seconds, reserved=0):
+        """
+        seconds were spent on other work in between the pictures, like extracting a json file;
+        reserved seconds of the reserve after the face scan are no longer needed for it
+        """
+        self.other_seconds += seconds
+        self.deadline += reserved
+
+    @property
+    def not_analyzed(self):
+        return self.sampled_out + self.skipped
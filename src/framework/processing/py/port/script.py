@@ -3,25 +3,45 @@ from port.api.commands import CommandSystemDonate, CommandSystemExit, CommandUIR
 
 from port.extraction_functions import *
 from port.extraction_functions_dict import extraction_dict
-
-import zipfile
-import cv2
-from PIL import Image
-import numpy as np
-import pandas as pd
+from port.extractor_specs import stream_of
+from port.zip_index import DecompressionBudgetExceeded, load_json_member
+from port.api.table import Table, as_table
+from port.routing import compile_routes
+from port.profile import StudyProfile, load_profile
+from port.face_cache import open_face_cache
+from port.face_detectors import get_face_detector
+from port.scheduler import TimeBudget
+from port.image_hash import DuplicatePictures, dhash
+from port.progress import coalesce_progress
+from port.pipeline import ExtractionGraph
+from port.validation import (
+    DdpCheck,
+    check_ddp_file,
+    folder_name_check_ddp,
+    file_name_check_html,
+)
+
+import io
 import time
 import json
+import dataclasses
+from collections import deque
+from itertools import chain
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 ############################
 # MAIN FUNCTION INITIATING THE DONATION PROCESS
 ############################
 
 
-def process(sessionId, locale):
+def process(sessionId, locale, profile=None):
     key = "instagram-data-donation"
     meta_data = []
     meta_data.append(("debug", f"{key}: start"))
 
+    # Select the extractors and phases used in this study
+    profile = load_profile(profile)
+
     # STEP 1: Select DDP and extract automatically required data
 
     data = None
@@ -35,18 +55,65 @@ def process(sessionId, locale):
 
         # If user input
         if fileResult.__type__ == "PayloadString":
-            check_ddp = check_if_valid_instagram_ddp(fileResult.value)
+            ddp_check, zip_index = check_if_valid_instagram_ddp(
+                fileResult.value, profile.budget()
+            )
+            check_ddp = ddp_check.status
 
             if check_ddp == "valid":
+                meta_data.append(
+                    (
+                        "debug",
+                        f"{key}: {ddp_check.member_count} files, {ddp_check.total_size} bytes",
+                    )
+                )
                 meta_data.append(("debug", f"{key}: extracting file"))
 
-                # Automatically extract required data
-                extract_gen = extract_data(fileResult.value, locale)
+                # Face detection results of earlier uploads (IndexedDB in the browser)
+                face_cache = open_face_cache(
+                    get_face_detector(profile.face_detector).params
+                )
+
+                # Copies of a picture are only checked for faces once
+                face_duplicates = DuplicatePictures()
+
+                # Time the extraction may take, None for no limit
+                time_budget = None
+                if profile.time_budget is not None:
+                    time_budget = TimeBudget(profile.time_budget)
+
+                # Automatically extract required data, rendering at most a few progress updates per second
+                extract_gen = coalesce_progress(
+                    extract_data(
+                        zip_index,
+                        locale,
+                        profile,
+                        face_cache=face_cache,
+                        time_budget=time_budget,
+                        face_duplicates=face_duplicates,
+                    )
+                )
+
+                # Number of extracted tables shown in the consent form so far
+                shown = 0
 
                 while True:
                     try:
                         # Get the next progress update from the generator
                         message, percentage, data = next(extract_gen)
+
+                        # Render the consent form early with the tables extracted so far
+                        if profile.progressive_consent:
+                            finished = sum(table is not None for table in data)
+                            if finished > shown:
+                                shown = finished
+                                prompt = prompt_consent(
+                                    data, meta_data, locale, profile, complete=False
+                                )
+                                yield render_donation_page(prompt)
+                            if shown:
+                                continue
+
                         # Create a progress message for the UI
                         promptMessage = prompt_extraction_message(message, percentage)
                         # Render the progress page
@@ -55,6 +122,22 @@ def process(sessionId, locale):
                         # The generator is exhausted, break the loop
                         break
 
+                zip_index.close()
+
+                if face_duplicates.lookups:
+                    meta_data.append(
+                        (
+                            "debug",
+                            f"{key}: face scan: {face_duplicates.hits} of {face_duplicates.lookups} pictures "
+                            f"were duplicates ({face_duplicates.hit_rate:.0%})",
+                        )
+                    )
+
+                # Record what was left out to stay within the time budget
+                if time_budget is not None:
+                    for note in time_budget.notes:
+                        meta_data.append(("debug", f"{key}: {note}"))
+
                 meta_data.append(
                     ("debug", f"{key}: extraction successful, go to consent form")
                 )
@@ -104,7 +187,7 @@ def process(sessionId, locale):
 
     meta_data.append(("debug", f"{key}: prompt consent"))
     # Render donation page with extracted data
-    prompt = prompt_consent(data, meta_data, locale)
+    prompt = prompt_consent(data, meta_data, locale, profile)
     consent_result = yield render_donation_page(prompt)
 
     # Send data if consent
@@ -188,48 +271,42 @@ def retry_confirmation_no_ddp():
     return props.PropsUIPromptConfirm(text, ok)
 
 
-def check_if_valid_instagram_ddp(filename):
-    folder_name_check_ddp = "ads_information"
-    file_name_check_html = "start_here.html"
+def check_if_valid_instagram_ddp(filename, budget=None):
+    """
+    checks the zip file and indexes it if valid, with the decompression budget of its members;
+    returns the check result and the index (None if not valid)
+    """
 
     try:
-        with zipfile.ZipFile(filename, "r") as zip_ref:
-            found_folder_name_check_ddp = False
-            found_file_name_check_html = False
+        # The zip file is indexed while it is checked
+        ddp_check, zip_index = check_ddp_file(filename, budget)
 
-            for file_info in zip_ref.infolist():
-                if folder_name_check_ddp in file_info.filename:
-                    found_folder_name_check_ddp = True
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return DdpCheck("invalid_file_error"), None
 
-                elif file_name_check_html in file_info.filename:
-                    found_file_name_check_html = True
+    if ddp_check.status == "invalid_file_zip":
+        print("Invalid ZIP file.")
 
-            if found_folder_name_check_ddp:
-                if found_file_name_check_html:
-                    print(
-                        f"Folder '{folder_name_check_ddp}' found and file {file_name_check_html} found in the ZIP file. Seems like a Instagram HTML DDP."
-                    )
-                    return "invalid_no_json"
+    elif ddp_check.status == "invalid_file_error":
+        print("Corrupt ZIP file.")
 
-                else:
-                    print(
-                        f"Folder '{folder_name_check_ddp}' found and file {file_name_check_html} not found in the ZIP file. Seems like a real Instagram JSON DDP."
-                    )
-                    return "valid"
+    elif ddp_check.status == "invalid_no_json":
+        print(
+            f"Folder '{folder_name_check_ddp}' found and file {file_name_check_html} found in the ZIP file. Seems like a Instagram HTML DDP."
+        )
 
-            else:
-                print(
-                    f"Folder '{folder_name_check_ddp}' not found. Does not seem like an Instagram DDP."
-                )
-                return "invalid_no_ddp"
+    elif ddp_check.status == "invalid_no_ddp":
+        print(
+            f"Folder '{folder_name_check_ddp}' not found. Does not seem like an Instagram DDP."
+        )
 
-    except zipfile.BadZipFile:
-        print("Invalid ZIP file.")
-        return "invalid_file_zip"
+    else:
+        print(
+            f"Folder '{folder_name_check_ddp}' found and file {file_name_check_html} not found in the ZIP file. Seems like a real Instagram JSON DDP."
+        )
 
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return "invalid_file_error"
+    return ddp_check, zip_index
 
 
 def prompt_extraction_message(message, percentage):
@@ -249,90 +326,187 @@ def prompt_extraction_message(message, percentage):
 
 
 # Main function to process zip files
-def extract_data(filename, locale):
-    """takes zip folder, extracts relevant json file contents, then extracts & processes relevant information and returns them as dataframes"""
-
-    data = []
+def extract_data(
+    zip_index,
+    locale,
+    profile=None,
+    executor=None,
+    face_workers=None,
+    face_cache=None,
+    time_budget=None,
+    face_duplicates=None,
+):
+    """
+    takes indexed zip folder, extracts relevant json file contents, then extracts & processes relevant information and returns them as dataframes
+
+    Only the extractors selected by the study profile run, and pictures are only analyzed if one of them needs it.
+    The extractors run while the pictures are checked (see ExtractionGraph): the ones without
+    "picture_info" in between the pictures, the others as soon as the pictures they reference are done.
+
+    If an executor (like a ProcessPoolExecutor, not available in the browser) is given,
+    every file is inflated, parsed and extracted by a task in the executor, the tables
+    are stored in the order of extraction_dict as the tasks complete.
+    If face_workers is given, pictures are checked for faces in a pool of that many threads,
+    and with a face_cache pictures already checked in an earlier upload are skipped.
+    With a time_budget, pictures are left out of the face scan if it would not finish in time,
+    and with face_duplicates (DuplicatePictures) copies of a picture are only checked once
+    """
+
+    profile = profile or StudyProfile()
+    selected = profile.select(extraction_dict)
+
+    data = [None] * len(selected)
 
     # Check if and how many faces are in pictures
     picture_info = {}
-    face_gen = check_faces_in_zip(filename, locale)
-
-    # Generator to check if faces in picture, which also updates the progress bar
-    for message, percentage, face_dict in face_gen:
-        picture_info = face_dict
-        yield message, percentage, data
-
-    for index, (file, v) in enumerate(extraction_dict.items(), start=1):
-        # Extract json from file name based on "key"
-        file_json = extractJsonContentFromZipFolder(filename, file)
-
-        if file_json is not None:
-            try:
-                # Call the "value" extraction function
-                if (
-                    "picture_info" in v
-                ):  # Check if picture_info is required for this extraction function
-                    file_json_df = v["extraction_function"](
-                        file_json, picture_info, locale
-                    )
-                else:
-                    file_json_df = v["extraction_function"](file_json, locale)
 
-            except Exception as e:
-                # if it fails for some reason
+    # Resolve the file of every selected "key" once
+    plan = compile_routes(selected, zip_index.json_files)
 
-                translatedMessage = props.Translatable(
-                    {
-                        "en": "extraction failed - ",
-                        "de": "Extrahierung fehlgeschlagen - ",
-                        "nl": "Extractie mislukt - ",
-                    }
-                )
+    for file in plan.unmatched:
+        print(f"File {file}.json does not exist")
 
-                file_json_df = pd.DataFrame(
-                    [
-                        f"{translatedMessage.translations[locale]}{file, type(e).__name__}"
-                    ],
-                    columns=[str(file)],
+    for file, candidates in plan.ambiguous.items():
+        print(f"File {file}.json is ambiguous, using {candidates[0]} of {candidates}")
+
+    # Json content read before the extraction, by file
+    loaded = {}
+
+    # Pictures referenced by each extractor using picture_info, it waits for their results
+    needs = {}
+
+    # Extraction progress of the files
+    translatedMessage = props.Translatable(
+        {
+            "en": "Data extraction from file: ",
+            "de": "Daten-Extrahierung aus der Datei: ",
+            "nl": "Gegevens extractie uit het bestand: ",
+        }
+    )
+    extracted = 0
+
+    face_scan = profile.needs_face_scan(selected)
+
+    if face_scan:
+        # The json content of the extractors using picture_info is read first,
+        # it tells which pictures they need and is kept for the extraction
+        for file, v in selected.items():
+            if "picture_info" in v:
+                loaded[file] = extractJsonContentFromZipFolder(
+                    zip_index, plan.routes[file], stream_of(v)
                 )
+                needs[file] = collect_media_uris([loaded[file]], zip_index)
+
+        referenced = collect_media_uris(loaded.values(), zip_index)
 
+        if profile.referenced_media_only:
+            # Only check the pictures referenced by the extractors using picture_info
+            face_files = referenced
         else:
-            translatedMessage1 = props.Translatable(
-                {
-                    "en": f'(file "{str(file)}" missing)',
-                    "de": f'(Datei "{str(file)}" fehlt)',
-                    "nl": f'(bestand "{str(file)}" ontbreekt)',
-                }
-            )
+            # Referenced pictures first, so the extractors waiting for them run early
+            referenced_set = set(referenced)
+            face_files = referenced + [
+                file for file in zip_index.members if file not in referenced_set
+            ]
+
+    else:
+        # Pictures are not analyzed in this study, the extractors using picture_info
+        # show them as not analyzed (like the face scan does for the members it skips)
+        picture_info = dict.fromkeys(zip_index.members, "picture_not_analyzed")
+
+    # Extractors run as soon as the pictures they need are checked
+    graph = ExtractionGraph(plan.routes, needs)
+
+    # With an executor, the extractors not needing pictures run there during the face scan
+    futures = {}
+    if executor is not None:
+        futures = submitFilesToExecutor(
+            zip_index, plan, graph.take_independent(), executor, picture_info, locale
+        )
 
-            translatedMessage2 = props.Translatable(
-                {
-                    "en": "No information",
-                    "de": "Keine Informationen",
-                    "nl": "Geen informatie",
-                }
+    if face_scan:
+        schedule = None
+        if time_budget is not None:
+            # The face scan gets the time not needed for the json files extracted here
+            # (the ones in the executor run alongside the face scan)
+            submitted = {file for _, file in futures.values()}
+            pictures = set(zip_index.media_images).intersection(face_files)
+            reserve = time_budget.estimate_json(
+                zip_index,
+                [
+                    plan.routes[file]
+                    for file in selected
+                    if file not in loaded and file not in submitted
+                ],
             )
+            schedule = time_budget.face_schedule(len(pictures), reserve)
+
+        face_gen = check_faces_in_zip(
+            zip_index,
+            locale,
+            face_workers,
+            face_files,
+            face_cache,
+            get_face_detector(profile.face_detector),
+            schedule,
+            face_duplicates,
+        )
 
-            file_json_df = pd.DataFrame(
-                [translatedMessage1.translations[locale]],
-                columns=[translatedMessage2.translations[locale]],
-            )
+        # Generator to check if faces in picture, which also updates the progress bar
+        for message, percentage, face_dict in face_gen:
+            picture_info = face_dict
 
-        data.append(file_json_df)
+            # The picture checked last
+            if face_dict:
+                graph.picture_done(next(reversed(face_dict)))
 
-        # Yield progress update
-        translatedMessage = props.Translatable(
-            {
-                "en": "Data extraction from file: ",
-                "de": "Daten-Extrahierung aus der Datei: ",
-                "nl": "Gegevens extractie uit het bestand: ",
-            }
+            # Extractors whose pictures are all checked, and in between the pictures
+            # one of the others (in the browser there is only this one thread)
+            for index, file in graph.take_ready() + graph.take_independent(1):
+                started = time.monotonic()
+                data[index] = extractPlannedFile(
+                    zip_index, plan, file, loaded, picture_info, locale
+                )
+                extracted += 1
+
+                # The file took time of the face scan, but no longer needs its reserve
+                if schedule is not None:
+                    reserved = 0
+                    if file not in loaded:
+                        reserved = time_budget.estimate_json(
+                            zip_index, [plan.routes[file]]
+                        )
+                    schedule.other_work_done(time.monotonic() - started, reserved)
+
+            yield message, percentage, data
+
+        if schedule is not None and schedule.not_analyzed:
+            time_budget.notes.append(
+                f"face scan: {schedule.not_analyzed} of {schedule.picture_count} pictures not analyzed "
+                f"to stay within {time_budget.seconds} seconds "
+                f"({schedule.sampled_out} sampled out, {schedule.skipped} after the deadline)"
+            )
+
+    # The files not extracted yet, one after the other and from the executor as they complete
+    remaining = (
+        (
+            index,
+            file,
+            extractPlannedFile(zip_index, plan, file, loaded, picture_info, locale),
         )
+        for index, file in graph.take_remaining()
+    )
+
+    for index, file, table in chain(
+        remaining, collectFilesFromExecutor(futures, locale)
+    ):
+        data[index] = table
+        extracted += 1
 
+        # Yield progress update
         yield (
             f"{translatedMessage.translations[locale]}{file}",
-            (index / len(extraction_dict)) * 100,
+            (extracted / len(selected)) * 100,
             data,
         )
 
@@ -347,78 +521,312 @@ def extract_data(filename, locale):
     yield f"{translatedMessage.translations[locale]}", 100, data
 
 
-# Count faces for each picture
-def check_faces_in_zip(filename, locale):
-    """This function checks the number of faces in each image file within a zip file."""
+# Run the extraction function of one file of extraction_dict
+def extract_file(file, file_json, picture_info, locale):
+    """takes the json content of a file (None if missing) and returns the extracted table"""
 
-    face_dict = {}
+    v = extraction_dict[file]
+
+    if file_json is not None:
+        try:
+            # Reading the file failed because it inflates beyond the decompression budget
+            if isinstance(file_json, DecompressionBudgetExceeded):
+                raise file_json
+
+            # Call the "value" extraction function
+            if (
+                "picture_info" in v
+            ):  # Check if picture_info is required for this extraction function
+                file_json_df = v["extraction_function"](file_json, picture_info, locale)
+            else:
+                file_json_df = v["extraction_function"](file_json, locale)
+
+        except Exception as e:
+            # if it fails for some reason
+            file_json_df = extraction_failed(file, e, locale)
+
+    else:
+        translatedMessage1 = props.Translatable(
+            {
+                "en": f'(file "{str(file)}" missing)',
+                "de": f'(Datei "{str(file)}" fehlt)',
+                "nl": f'(bestand "{str(file)}" ontbreekt)',
+            }
+        )
+
+        translatedMessage2 = props.Translatable(
+            {
+                "en": "No information",
+                "de": "Keine Informationen",
+                "nl": "Geen informatie",
+            }
+        )
+
+        file_json_df = Table(
+            {
+                translatedMessage2.translations[locale]: [
+                    translatedMessage1.translations[locale]
+                ]
+            }
+        )
 
-    # Load face cascade classifier
-    face_cascade = cv2.CascadeClassifier(
-        cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+    return file_json_df
+
+
+# Table shown for a file whose extraction failed
+def extraction_failed(file, e, locale):
+    translatedMessage = props.Translatable(
+        {
+            "en": "extraction failed - ",
+            "de": "Extrahierung fehlgeschlagen - ",
+            "nl": "Extractie mislukt - ",
+        }
     )
 
-    # Set the desired size for the images
-    size = 200, 200
+    return Table(
+        {
+            str(file): [
+                f"{translatedMessage.translations[locale]}{file, type(e).__name__}"
+            ]
+        }
+    )
 
-    # Open the zip file in read mode
-    with zipfile.ZipFile(filename, "r") as zip_ref:
-        # Iterate through each file in the zip file
-        for index, file in enumerate(zip_ref.namelist(), start=1):
-            # Check if the file is a jpg image and in the media folder
-            if file.lower().endswith(".jpg") and file.lower().startswith("media"):
-                # Open the image file within the zip file
-                with zip_ref.open(file) as img_file:
-                    start_time = time.time()  # Record start time
 
-                    # Load the image from bytes
-                    img_bytes = Image.open(img_file)
+# Pictures referenced in json content
+def collect_media_uris(file_jsons, zip_index):
+    """
+    returns the members referenced by a "uri" anywhere in the json contents,
+    in order of the files and their content and without duplicates
+    """
 
-                    # Convert the image to grayscale
-                    img_gray = img_bytes.convert("L")
+    def iter_uris(value):
+        if isinstance(value, dict):
+            for k, v in value.items():
+                if k == "uri" and isinstance(v, str):
+                    yield v
+                else:
+                    yield from iter_uris(v)
+        elif isinstance(value, list):
+            for v in value:
+                yield from iter_uris(v)
 
-                    # Resize the image to the desired size
-                    img_gray.thumbnail(size, Image.Resampling.LANCZOS)
+    uris = dict.fromkeys(
+        uri for file_json in file_jsons for uri in iter_uris(file_json)
+    )
 
-                    # Convert the image to a numpy array
-                    img_down_np = np.array(img_gray)
+    # Uris of pictures missing in the zip file are never analyzed
+    return [uri for uri in uris if uri in zip_index.infos]
 
-                    # Detect faces in the image
-                    faces = face_cascade.detectMultiScale(
-                        img_down_np, scaleFactor=1.1, minNeighbors=6, minSize=(30, 30)
-                    )
 
-                    end_time = time.time()  # Record end time
-                    processing_time = end_time - start_time  # Calculate processing time
-                    print(
-                        "PLI - Processing time for {}: {:.2f} seconds".format(
-                            file, processing_time
-                        )
-                    )
+# Check if there is a face in one picture
+def detect_faces(img_file, file, detector, duplicates=None):
+    """
+    returns True if the detector finds a face in the image file, False otherwise,
+    copies of a picture already checked get its result
+    """
+
+    start_time = time.time()  # Record start time
+
+    img_gray = detector.prepare(img_file)
+
+    faces_found = None
+    if duplicates is not None:
+        key = dhash(img_gray)
+        faces_found = duplicates.get(key)
+
+    if faces_found is None:
+        faces_found = detector.detect(img_gray)
+        if duplicates is not None:
+            duplicates.put(key, faces_found)
+
+    end_time = time.time()  # Record end time
+    processing_time = end_time - start_time  # Calculate processing time
+    print("PLI - Processing time for {}: {:.2f} seconds".format(file, processing_time))
 
-                    # Count faces in picture
-                    if len(faces) == 0:
-                        face_dict[file] = False
-                    else:
-                        face_dict[file] = True
+    return faces_found
+
+
+def check_faces_in_image(
+    zip_index, file, detector, cache=None, schedule=None, duplicates=None
+):
+    # Result of an earlier upload of the same picture
+    if cache is not None:
+        cached = cache.get(zip_index.infos[file])
+        if cached is not None:
+            return cached
+
+    # Left out to finish within the time budget
+    if schedule is not None and not schedule.analyze():
+        return "picture_not_analyzed"
+
+    try:
+        # Open the image file within the zip file, it is not kept after the check
+        with zip_index.open(file, retained=False) as img_file:
+            result = detect_faces(img_file, file, detector, duplicates)
+
+        if schedule is not None:
+            schedule.picture_finished()
+        return result
+
+    except DecompressionBudgetExceeded as e:
+        # Skip images that inflate beyond the decompression budget
+        print(e)
+        return "picture_not_analyzed"
+
+
+def check_faces_in_threads(
+    zip_index,
+    files,
+    media_images,
+    detector,
+    workers,
+    cache=None,
+    schedule=None,
+    duplicates=None,
+):
+    """
+    yields (file, result) for all files in order,
+    while the pictures are decoded and checked in a pool of workers threads
+
+    The zip file is only read by the calling thread, and at most 2 * workers
+    pictures are kept in memory waiting for a thread.
+    """
+
+    pending = deque()
+    in_flight = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for file in files:
+            cached = None
+            if cache is not None and file in media_images:
+                cached = cache.get(zip_index.infos[file])
+
+            if cached is not None:
+                result = cached
+            elif (
+                file in media_images and schedule is not None and not schedule.analyze()
+            ):
+                # Left out to finish within the time budget
+                result = "picture_not_analyzed"
+            elif file in media_images:
+                try:
+                    with zip_index.open(file, retained=False) as img_file:
+                        img_bytes = io.BytesIO(img_file.read())
+                    result = executor.submit(
+                        detect_faces, img_bytes, file, detector, duplicates
+                    )
+                    in_flight += 1
+                except DecompressionBudgetExceeded as e:
+                    print(e)
+                    result = "picture_not_analyzed"
             else:
-                face_dict[file] = "picture_not_analyzed"
+                result = "picture_not_analyzed"
 
-            percentage = (index / len(zip_ref.namelist())) * 100
+            pending.append((file, result))
 
-            translatedMessage = props.Translatable(
-                {
-                    "en": "Extraction of image information: ",
-                    "de": "Extrahierung von Bild-Informationen: ",
-                    "nl": "Extraheren van beeldinformatie: ",
-                }
-            )
+            # Hand out results in zip order as soon as they are done
+            while pending:
+                file, result = pending[0]
+                if isinstance(result, Future):
+                    if not result.done() and in_flight <= 2 * workers:
+                        break
+                    result = result.result()
+                    in_flight -= 1
+                    if schedule is not None:
+                        schedule.picture_finished()
+                pending.popleft()
+                yield file, result
 
-            yield (
-                f"{translatedMessage.translations[locale]}{file}",
-                percentage,
-                face_dict,
+        for file, result in pending:
+            yield file, result.result() if isinstance(result, Future) else result
+
+
+# Count faces for each picture
+def check_faces_in_zip(
+    zip_index,
+    locale,
+    workers=None,
+    files=None,
+    cache=None,
+    detector=None,
+    schedule=None,
+    duplicates=None,
+):
+    """
+    This function checks the number of faces in each image file within a zip file.
+
+    If files is given, only these members are checked (in that order) instead of all members.
+    If workers is given, the pictures are checked in a pool of that many threads
+    (OpenCV releases the GIL while detecting, so this helps outside the browser).
+    If a face cache is given, pictures with a cached result are not decoded, and new results are added to it.
+    The detector defaults to the Haar cascade detector.
+    If a schedule is given, it decides which pictures are analyzed to finish in time.
+    With duplicates (DuplicatePictures), copies of a picture reuse the result of the first one.
+    """
+
+    face_dict = {}
+    detector = detector or get_face_detector()
+
+    # Set of jpg images in the media folder, classified when indexing the zip file
+    media_images = set(zip_index.media_images)
+
+    if files is None:
+        files = zip_index.members
+    member_count = len(files)
+
+    if workers is None:
+        # Check one picture after the other
+        results = (
+            (
+                file,
+                (
+                    check_faces_in_image(
+                        zip_index, file, detector, cache, schedule, duplicates
+                    )
+                    if file in media_images
+                    else "picture_not_analyzed"
+                ),
             )
+            for file in files
+        )
+    else:
+        results = check_faces_in_threads(
+            zip_index,
+            files,
+            media_images,
+            detector,
+            workers,
+            cache,
+            schedule,
+            duplicates,
+        )
+
+    # Iterate through each file in the zip file
+    for index, (file, result) in enumerate(results, start=1):
+        face_dict[file] = result
+
+        # Remember the result (also refreshes cached results)
+        if cache is not None and file in media_images and isinstance(result, bool):
+            cache.put(zip_index.infos[file], result)
+
+        percentage = (index / member_count) * 100
+
+        translatedMessage = props.Translatable(
+            {
+                "en": "Extraction of image information: ",
+                "de": "Extrahierung von Bild-Informationen: ",
+                "nl": "Extraheren van beeldinformatie: ",
+            }
+        )
+
+        yield (
+            f"{translatedMessage.translations[locale]}{file}",
+            percentage,
+            face_dict,
+        )
+
+    if cache is not None:
+        cache.save()
 
     # Return the dictionary containing the number of faces in each image
     translatedMessage = props.Translatable(
@@ -429,41 +837,127 @@ def check_faces_in_zip(filename, locale):
         }
     )
 
+    message = translatedMessage.translations[locale]
+
+    # Share of the pictures that were copies of an earlier one
+    if duplicates is not None and duplicates.lookups:
+        translatedDuplicates = props.Translatable(
+            {
+                "en": "duplicate pictures",
+                "de": "doppelte Bilder",
+                "nl": "dubbele afbeeldingen",
+            }
+        )
+        message += f" ({duplicates.hits}/{duplicates.lookups} {translatedDuplicates.translations[locale]})"
+
     yield (
-        f"{translatedMessage.translations[locale]}",
+        message,
         100,
         face_dict,
     )
 
 
 # Exract json content from given file
-def extractJsonContentFromZipFolder(zip_file_path, pattern):
-    with zipfile.ZipFile(zip_file_path, "r") as zip_ref:
-        # Get the list of file names in the zip file
-        file_names = zip_ref.namelist()
+def extractJsonContentFromZipFolder(zip_index, file_name, stream=None):
+    # The file was not resolved
+    if file_name is None:
+        return None
 
-        file_json_dict = {}
+    try:
+        # Read the JSON file into a dictionary
+        return zip_index.read_json(file_name, stream)
+
+    except DecompressionBudgetExceeded as e:
+        # Report as failed extraction, not as missing file
+        print(e)
+        return e
+
+    except:
+        return None
+
+
+# Extract one file of the zip in a worker of an executor
+def extract_member(zip_filename, file, file_name, picture_info, locale, budget=None):
+    """
+    reads, parses and extracts one file of extraction_dict, for workers of an executor
+
+    Only names are passed (the extraction function is looked up by file), so the
+    task can be sent to other processes, which cannot use the open ZipIndex either
+    """
+
+    file_json = None
+
+    if file_name is not None:
+        try:
+            file_json = load_json_member(
+                zip_filename, file_name, stream_of(extraction_dict[file]), budget
+            )
+        except DecompressionBudgetExceeded as e:
+            # Report as failed extraction, not as missing file
+            print(e)
+            file_json = e
+        except:
+            pass
+
+    return extract_file(file, file_json, picture_info, locale)
 
-        for file_name in file_names:
-            if (file_name.endswith(".json")) and (pattern in file_name):
-                try:
-                    # Read the JSON file into a dictionary
-                    with zip_ref.open(file_name) as json_file:
-                        json_content = json_file.read()
-                        data = json.loads(json_content)
-                        file_json_dict[file_name] = data
 
-                    break
+# Extract one file of the plan here
+def extractPlannedFile(zip_index, plan, file, loaded, picture_info, locale):
+    """extracts a file of the plan, using its json content if it is in loaded"""
 
-                except:
-                    return None
+    if file in loaded:
+        file_json = loaded[file]
+    else:
+        file_json = extractJsonContentFromZipFolder(
+            zip_index, plan.routes[file], stream_of(extraction_dict[file])
+        )
+
+    return extract_file(file, file_json, picture_info, locale)
+
+
+# Extract files of the plan in an executor
+def submitFilesToExecutor(zip_index, plan, files, executor, picture_info, locale):
+    """submits a task per (index, file) of files, returns the (index, file) by future"""
+
+    futures = {}
+
+    # Every worker gets the limits of the budget for its member
+    budget = dataclasses.replace(zip_index.budget, total_read=0)
+
+    for index, file in files:
+        # Only the extractors using picture_info get it sent along
+        future = executor.submit(
+            extract_member,
+            zip_index.filename,
+            file,
+            plan.routes[file],
+            picture_info if "picture_info" in extraction_dict[file] else {},
+            locale,
+            budget,
+        )
+        futures[future] = index, file
+
+    return futures
+
+
+def collectFilesFromExecutor(futures, locale):
+    """
+    yields (index, file, extracted table) of the submitted files in order of completion,
+    a failing task only fails the table of its file
+    """
 
-            # checks if loop is at last item
-            if file_name == file_names[-1]:
-                print(f"File {pattern}.json does not exist")
-                return None
+    for future in as_completed(futures):
+        index, file = futures[future]
 
-    return file_json_dict[file_name]
+        try:
+            table = future.result()
+        except Exception as e:
+            # The worker failed, like a process of the pool that died
+            print(f"Extraction of {file} failed in the executor: {e!r}")
+            table = extraction_failed(file, e, locale)
+
+        yield index, file, table
 
 
 ############################
@@ -472,8 +966,14 @@ def extractJsonContentFromZipFolder(zip_file_path, pattern):
 
 
 # Main content of consent page: display all extracted data
-def prompt_consent(data, meta_data, locale):
-    print(meta_data)
+def prompt_consent(data, meta_data, locale, profile=None, complete=True):
+    """
+    consent form of the extracted tables, with complete=False tables not extracted
+    yet (None in data) are placeholders and the form cannot be submitted yet
+    """
+
+    if complete:
+        print(meta_data)
 
     table_list = []
     i = 0
@@ -482,17 +982,29 @@ def prompt_consent(data, meta_data, locale):
     binary_data = []
 
     if data is not None:  # can happen if user submits wrong file and still continues
-        for file, v in extraction_dict.items():
-            df = data[i]
+        profile = profile or StudyProfile()
+
+        for file, v in profile.select(extraction_dict).items():
+            # Not extracted yet, shown as a placeholder
+            if data[i] is None:
+                table = props.PropsUIPromptConsentFormTable(
+                    file, props.Translatable(v["title"]), Table(), pending=True
+                )
+                table_list.append(table)
+                i += 1
+                continue
+
+            df = as_table(data[i])
 
             # Check if the dataframe has only one row
             if len(df) == 1:
+                # Dates are kept as days until they are shown
+                df = props.format_dates(df)
                 # Extract the title from the 'en' translation
                 translated_title = v["title"][locale]
                 # Combine values from all columns into a single string
-                combined_value = " |> ".join(
-                    [f"{col}: {df.iloc[0][col]}" for col in df.columns]
-                )
+                row = df.row(0)
+                combined_value = " |> ".join([f"{col}: {row[col]}" for col in row])
                 binary_data.append([translated_title, combined_value])
             else:
                 # Directly add multi-row dataframes to the table list
@@ -505,7 +1017,12 @@ def prompt_consent(data, meta_data, locale):
 
         # Create a dataframe for binary data if there are any single-row entries
         if binary_data:
-            binary_df = pd.DataFrame(binary_data, columns=["Kategorie", "Daten"])
+            binary_df = Table(
+                {
+                    "Kategorie": [title for title, _ in binary_data],
+                    "Daten": [value for _, value in binary_data],
+                }
+            )
             table = props.PropsUIPromptConsentFormTable(
                 "binary_results",
                 props.Translatable(
@@ -516,9 +1033,11 @@ def prompt_consent(data, meta_data, locale):
                     }
                 ),
                 binary_df,
+                # more rows can follow
+                pending=not complete,
             )
             table_list.append(table)
-    return props.PropsUIPromptConsentForm(table_list, [])
+    return props.PropsUIPromptConsentForm(table_list, [], complete=complete)
 
 
 # pass on user decision to donate or decline donation
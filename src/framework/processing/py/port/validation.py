@@ -0,0 +1,87 @@
+import zipfile
+from dataclasses import dataclass
+
+from port.zip_index import ZipIndex
+
+############################
+# Check if a file is an Instagram DDP while indexing it
+############################
+
+folder_name_check_ddp = "ads_information"
+file_name_check_html = "start_here.html"
+
+# zip file signatures (see APPNOTE.TXT)
+_MAGIC_LOCAL_FILE = b"PK\x03\x04"
+_MAGIC_EMPTY_ZIP = b"PK\x05\x06"
+
+
+@dataclass
+class DdpCheck:
+    """Result of checking a file
+
+    Attributes:
+        status: "valid" (JSON DDP), "invalid_no_json" (HTML DDP), "invalid_no_ddp" (zip file but no DDP),
+            "invalid_file_zip" (no zip file) or "invalid_file_error" (corrupt zip file)
+        member_count: number of members in the zip file
+        total_size: total uncompressed size of the members
+    """
+
+    status: str
+    member_count: int = 0
+    total_size: int = 0
+
+
+def check_ddp_members(zip_index):
+    """
+    Check whether an indexed zip file is an Instagram JSON DDP,
+    stops looking at the members as soon as the HTML markers are found
+    """
+
+    member_count = len(zip_index.members)
+    total_size = sum(info.file_size for info in zip_index.infos.values())
+
+    found_folder_name_check_ddp = False
+    found_file_name_check_html = False
+
+    for name in zip_index.members:
+        if folder_name_check_ddp in name:
+            found_folder_name_check_ddp = True
+        elif file_name_check_html in name:
+            found_file_name_check_html = True
+
+        # Instagram HTML DDP, no need to look any further
+        if found_folder_name_check_ddp and found_file_name_check_html:
+            return DdpCheck("invalid_no_json", member_count, total_size)
+
+    if found_folder_name_check_ddp:
+        return DdpCheck("valid", member_count, total_size)
+
+    return DdpCheck("invalid_no_ddp", member_count, total_size)
+
+
+def check_ddp_file(filename, budget=None):
+    """
+    Check whether filename is an Instagram JSON DDP,
+    returns the DdpCheck and the ZipIndex of the file (None if it is not a valid DDP),
+    which reads the members within budget (the default DecompressionBudget if None)
+
+    Fails fast on files that do not start like a zip file. The central directory is only
+    read once, by the ZipIndex that is then shared with the extraction.
+    """
+
+    with open(filename, "rb") as file:
+        if file.read(4) not in (_MAGIC_LOCAL_FILE, _MAGIC_EMPTY_ZIP):
+            return DdpCheck("invalid_file_zip"), None
+
+    try:
+        zip_index = ZipIndex(filename, budget)
+    except (zipfile.BadZipFile, EOFError, ValueError):
+        return DdpCheck("invalid_file_error"), None
+
+    ddp_check = check_ddp_members(zip_index)
+
+    if ddp_check.status != "valid":
+        zip_index.close()
+        return ddp_check, None
+
+    return ddp_check, zip_index
@@ -0,0 +1,251 @@
+import contextlib
+import io
+import json
+import zipfile
+from dataclasses import dataclass
+
+from port.json_stream import iter_projected
+
+############################
+# Decompression budget
+############################
+
+MiB = 1024 * 1024
+
+
+class DecompressionBudgetExceeded(Exception):
+    """A member inflates to more than it declares or than the decompression budget allows"""
+
+
+@dataclass
+class DecompressionBudget:
+    """Limits on how much the members of one upload may inflate to
+
+    The defaults keep the members held in memory well within the wasm32 heap of
+    Pyodide, which also has to fit the parsed json. Native runs can raise them
+    through the study profile.
+
+    Attributes:
+        max_member_size: maximum number of uncompressed bytes of one member read at once
+            (a json file that is not streamed, a picture)
+        max_streamed_size: maximum number of uncompressed bytes of one streamed json member,
+            which is decoded record by record and never held in memory at once
+        max_ratio: maximum ratio of uncompressed to compressed bytes of one member
+        min_ratio_size: members smaller than this are never rejected for their ratio
+        max_total_size: maximum number of uncompressed bytes read from all retained members (the json files
+            read at once, not the streamed ones or the pictures that are only streamed through the face scan)
+        total_read: number of uncompressed bytes read so far from retained members
+    """
+
+    max_member_size: int = 64 * MiB
+    max_streamed_size: int = 1024 * MiB
+    max_ratio: float = 200
+    min_ratio_size: int = 1 * MiB
+    max_total_size: int = 512 * MiB
+    total_read: int = 0
+
+    def check_member(self, zip_info, streamed=False):
+        """reject members whose declared sizes are already over budget"""
+        self._check(zip_info, zip_info.file_size, streamed, declared=True)
+
+    def consume(self, zip_info, member_read, size, retained=True, streamed=False):
+        """
+        account for size more bytes read from a member, member_read bytes including these,
+        only retained members count toward the total
+        """
+        if retained:
+            self.total_read += size
+        if member_read > zip_info.file_size:
+            raise DecompressionBudgetExceeded(
+                f"{zip_info.filename} inflates to more than the declared {zip_info.file_size} bytes"
+            )
+        self._check(zip_info, member_read, streamed)
+
+    def _check(self, zip_info, size, streamed=False, declared=False):
+        which = "declared" if declared else "read"
+        max_size = self.max_streamed_size if streamed else self.max_member_size
+        if size > max_size:
+            raise DecompressionBudgetExceeded(
+                f"{zip_info.filename}: {size} bytes {which}, more than {max_size}"
+            )
+        if size > self.min_ratio_size and size > self.max_ratio * max(
+            zip_info.compress_size, 1
+        ):
+            raise DecompressionBudgetExceeded(
+                f"{zip_info.filename}: {size} bytes {which} from {zip_info.compress_size} compressed bytes"
+            )
+        if self.total_read > self.max_total_size:
+            raise DecompressionBudgetExceeded(
+                f"more than {self.max_total_size} bytes read from the zip file"
+            )
+
+
+class BudgetedReader(io.RawIOBase):
+    """Reader of one zip member that checks every chunk against the decompression budget
+
+    A member that is not retained (a picture streamed through the face scan)
+    is only checked against the limits of one member. A streamed member (a json
+    file decoded record by record) is never retained and may be larger.
+    """
+
+    def __init__(self, zip_ref, zip_info, budget, retained=True, streamed=False):
+        budget.check_member(zip_info, streamed)
+        self.zip_info = zip_info
+        self.budget = budget
+        self.retained = retained and not streamed
+        self.streamed = streamed
+        self.file = zip_ref.open(zip_info)
+        self.member_read = 0
+
+    def readable(self):
+        return True
+
+    def _consume(self, data):
+        self.member_read += len(data)
+        self.budget.consume(
+            self.zip_info, self.member_read, len(data), self.retained, self.streamed
+        )
+        return data
+
+    def readinto(self, buffer):
+        data = self._consume(self.file.read(len(buffer)))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def read(self, size=-1):
+        if size is not None and size >= 0:
+            return self._consume(self.file.read(size))
+
+        chunks = []
+        while chunk := self._consume(self.file.read(MiB)):
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def readall(self):
+        return self.read()
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+############################
+# Index of the members of a DDP zip file
+############################
+
+
+class ZipIndex:
+    """Single pass index over the members of a DDP zip file
+
+    The zip file is opened once per upload and every member is classified
+    while walking the central directory, so the face scan and the json
+    extraction can do lookups instead of re-reading the zip file.
+
+    Attributes:
+        filename: path of the zip file
+        budget: decompression budget of all members read through the index
+        zip_ref: the open zip file handle shared by all phases
+        infos: zip info of every member by name
+        members: names of all members in the order of the zip file
+        json_files: names of all json members in the order of the zip file
+        media_images: names of all jpg members in the media folder
+    """
+
+    def __init__(self, filename, budget=None):
+        self.filename = filename
+        self.budget = budget or DecompressionBudget()
+        self.zip_ref = zipfile.ZipFile(filename, "r")
+
+        self.infos = {}
+        self.members = []
+        self.json_files = []
+        self.media_images = []
+
+        for file_info in self.zip_ref.infolist():
+            file = file_info.filename
+            self.infos[file] = file_info
+            self.members.append(file)
+
+            if file.endswith(".json"):
+                self.json_files.append(file)
+
+            elif file.lower().endswith(".jpg") and file.lower().startswith("media"):
+                self.media_images.append(file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.zip_ref.close()
+
+    def open(self, file, retained=True, streamed=False):
+        """
+        reader of a member, retained=False for members that are only streamed through,
+        streamed=True for json members decoded record by record
+        """
+        return BudgetedReader(
+            self.zip_ref, self.infos[file], self.budget, retained, streamed
+        )
+
+    def read_json(self, file, stream=None):
+        """
+        json content of a member, with a stream the records are read while they are extracted
+        (see _streamed_json)
+        """
+
+        if stream is not None:
+            return _streamed_json(lambda: self.open(file, streamed=True), stream)
+
+        with self.open(file) as json_file:
+            return json.loads(json_file.read())
+
+
+def _streamed_json(open_member, stream):
+    """
+    content of a streamed json file as json.load would give it (an object with the records
+    under stream["records"], or the records), but the records are a generator that opens the
+    member and decodes one record at a time while the extraction function iterates over them
+
+    Errors reading the member (like a missing records key) are raised by the generator.
+    """
+
+    def records():
+        with open_member() as json_file:
+            yield from iter_projected(json_file, stream["records"], stream["fields"])
+
+    if stream["records"] is None:
+        return records()
+
+    return {stream["records"]: records()}
+
+
+@contextlib.contextmanager
+def _open_member(filename, file, budget, streamed=False):
+    """opens a member of a zip file for reading, the zip file is closed with the member"""
+    with zipfile.ZipFile(filename, "r") as zip_ref:
+        with BudgetedReader(
+            zip_ref, zip_ref.getinfo(file), budget, streamed=streamed
+        ) as json_file:
+            yield json_file
+
+
+def load_json_member(filename, file, stream=None, budget=None):
+    """
+    parse one json member of a zip file, for workers in other processes that cannot use the open ZipIndex
+
+    The budget only covers this member, workers do not share the total of the session
+    """
+
+    budget = budget or DecompressionBudget()
+
+    if stream is not None:
+        return _streamed_json(
+            lambda: _open_member(filename, file, budget, streamed=True),
+            stream,
+        )
+
+    with _open_member(filename, file, budget) as json_file:
+        return json.loads(json_file.read())
@@ -0,0 +1,20 @@
+import json
+import zipfile
+
+import pytest
+
+
+@pytest.fixture
+def make_zip(tmp_path):
+    """writes a zip file with the given members (bytes, str, or json content), returns its path"""
+
+    def make(members, name="ddp.zip"):
+        path = tmp_path / name
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for member, content in members.items():
+                if not isinstance(content, (bytes, str)):
+                    content = json.dumps(content)
+                zip_file.writestr(member, content)
+        return str(path)
+
+    return make
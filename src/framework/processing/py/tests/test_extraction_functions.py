@@ -0,0 +1,170 @@
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from port.api.props import format_dates
+from port.extraction_functions import (
+    count_per_day,
+    epoch_to_date,
+    epochs_to_dates,
+    epochs_to_datetimes,
+    epochs_to_days,
+    format_days,
+)
+
+FALLBACK = date(1999, 1, 1)
+
+
+def reference_date(timestamp):
+    """the date of one timestamp like the former per row epoch_to_date, in UTC +1"""
+    try:
+        return datetime.fromtimestamp(
+            int(timestamp), tz=timezone(timedelta(hours=1))
+        ).date()
+    except Exception:
+        return FALLBACK
+
+
+def as_dates(days):
+    return [date(1970, 1, 1) + timedelta(days=int(day)) for day in days]
+
+
+@pytest.fixture
+def timestamps():
+    rng = np.random.default_rng(0)
+    # around 2023, with many timestamps close to midnight in UTC +1
+    near_midnight = (
+        1_672_527_600 + rng.integers(-3, 3, 500) * 86400 + rng.integers(-2, 2, 500)
+    )
+    spread = rng.integers(-(2**31), 2**33, 500)
+    return np.concatenate([near_midnight, spread])
+
+
+@pytest.mark.parametrize("order", ["sorted", "reversed", "unsorted"])
+def test_days_like_per_row_conversion(timestamps, order):
+    if order == "sorted":
+        timestamps = np.sort(timestamps)
+    elif order == "reversed":
+        timestamps = np.sort(timestamps)[::-1]
+
+    expected = [reference_date(t) for t in timestamps.tolist()]
+
+    assert as_dates(epochs_to_days(timestamps)) == expected
+    assert as_dates(epochs_to_days(timestamps.tolist())) == expected
+    assert as_dates(epochs_to_days([str(t) for t in timestamps.tolist()])) == expected
+    assert epochs_to_datetimes(timestamps).astype(object).tolist() == expected
+
+
+def test_floats_are_truncated_like_int():
+    timestamps = [1_672_527_599.9, -0.5, 86399.99, 1e9]
+
+    assert as_dates(epochs_to_days(timestamps)) == [
+        reference_date(t) for t in timestamps
+    ]
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [None, "", "abc", "1.5e9", [], [1], {}, float("nan"), float("inf"), 1e30, 2**70],
+)
+def test_fallback_for_values_that_are_no_timestamp(timestamp):
+    assert as_dates(epochs_to_days([timestamp])) == [FALLBACK]
+    assert as_dates(epochs_to_days([1_700_000_000, timestamp]))[1] == FALLBACK
+    assert epoch_to_date(timestamp) == "01-01-1999"
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        # years 1500 and 3000, which datetime can represent but not the former
+        # pandas datetimes: they failed the whole extraction, now only the row falls back
+        -14_831_769_600,
+        32_503_680_000,
+    ],
+)
+def test_fallback_out_of_the_supported_range(timestamp):
+    assert as_dates(epochs_to_days([timestamp])) == [FALLBACK]
+
+
+def test_no_timestamps():
+    assert epochs_to_days([]).tolist() == []
+    assert epochs_to_dates([]) == []
+
+
+def test_dates_for_display():
+    assert epochs_to_dates([1_672_527_599, 1_672_527_600, "x"]) == [
+        "31-12-2022",
+        "01-01-2023",
+        "01-01-1999",
+    ]
+    assert epoch_to_date(1_672_527_600) == "01-01-2023"
+    assert epoch_to_date("1672527600") == "01-01-2023"
+
+
+def unique_days_and_counts(timestamps):
+    """distinct days (chronological) and counts like np.unique, the reference of count_per_day"""
+    days, counts = np.unique(epochs_to_days(timestamps), return_counts=True)
+    return days.astype("datetime64[D]").tolist(), counts.tolist()
+
+
+@pytest.mark.parametrize(
+    "days",
+    [
+        # time ordered exports: runs of equal days
+        np.repeat(np.arange(19000, 19030), 7),
+        np.repeat(np.arange(19000, 19030), 7)[::-1],
+        # unordered within a narrow span: binned by day number
+        np.random.default_rng(1).integers(19000, 19060, 1000),
+        # unordered over decades: sorted
+        np.random.default_rng(2).integers(-20000, 90000, 300),
+        np.array([19000]),
+        np.array([19000, 19000, 19000]),
+        np.array([19001, 19000, 19001]),
+    ],
+)
+def test_count_per_day_like_np_unique(days):
+    rng = np.random.default_rng(3)
+    timestamps = days * 86400 - 3600 + rng.integers(0, 86400, len(days))
+
+    table = count_per_day(timestamps, "Date", "Count")
+
+    assert (
+        table.values("Date").tolist(),
+        table.values("Count").tolist(),
+    ) == unique_days_and_counts(timestamps)
+
+
+def test_count_per_day_of_no_timestamps():
+    table = count_per_day([], "Date", "Count")
+
+    assert table.titles == ["Date", "Count"]
+    assert len(table) == 0
+
+
+def test_fallback_days_are_counted_in_order():
+    table = count_per_day([1_700_000_000, None, "x", 900_000_000], "Date", "Count")
+
+    assert table.values("Date").astype(str).tolist() == [
+        "1998-07-09",
+        "1999-01-01",
+        "2023-11-14",
+    ]
+    assert table.values("Count").tolist() == [1, 2, 1]
+
+
+def test_days_are_formatted_only_for_display():
+    table = count_per_day(
+        [1_700_000_000, 1_672_527_600, 1_672_527_600], "Date", "Count"
+    )
+
+    formatted = format_dates(table)
+
+    # chronological, not sorted by the day of the month
+    assert formatted.values("Date").tolist() == ["01-01-2023", "14-11-2023"]
+    assert table.values("Date").dtype == np.dtype("datetime64[D]")
+    assert format_days(np.array([19358, 19358, 0])) == [
+        "01-01-2023",
+        "01-01-2023",
+        "01-01-1970",
+    ]
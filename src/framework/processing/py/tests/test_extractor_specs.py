@@ -0,0 +1,71 @@
+import pytest
+
+from port.extractor_specs import compile_spec, stream_of
+
+DAY = 1_700_000_000
+RECORDS = [
+    {"string_list_data": [{"timestamp": DAY}], "title": "a"},
+    {"string_list_data": [{"timestamp": DAY + 60}], "title": "b"},
+    {"string_list_data": [{"timestamp": DAY + 86400}]},
+]
+
+LIST_SPEC = {
+    "records": "impressions",
+    "timestamp": "string_list_data.0.timestamp",
+    "value": {"path": "title", "default": {"en": "unknown"}},
+    "aggregate": "list",
+    "title": {"en": "Titles"},
+}
+
+COUNT_SPEC = {
+    "records": "impressions",
+    "timestamp": "string_list_data.0.timestamp",
+    "aggregate": "count",
+    "title": {"en": "Count"},
+}
+
+
+def test_list_per_day():
+    extract = compile_spec(LIST_SPEC)
+
+    table = extract({"impressions": RECORDS}, "en")
+
+    assert table.titles == ["Date", "Titles"]
+    assert table.values("Titles").tolist() == [["a", "b"], ["unknown"]]
+
+
+def test_records_can_be_a_generator():
+    extract = compile_spec(COUNT_SPEC)
+
+    from_list = extract({"impressions": RECORDS}, "en")
+    from_generator = extract({"impressions": iter(RECORDS)}, "en")
+
+    assert from_generator.to_json() == from_list.to_json()
+    assert from_list.values("Count").tolist() == [2, 1]
+
+
+def test_missing_timestamp():
+    records = {"impressions": RECORDS + [{"title": "no timestamp"}]}
+
+    with pytest.raises(KeyError):
+        compile_spec(COUNT_SPEC)(records, "en")
+
+    skipped = compile_spec({**COUNT_SPEC, "missing": "skip"})(records, "en")
+    assert skipped.values("Count").tolist() == [2, 1]
+
+
+def test_stream_is_derived_from_the_paths():
+    extract = compile_spec({**LIST_SPEC, "stream": True})
+
+    assert stream_of({"extraction_function": extract}) == {
+        "records": "impressions",
+        "fields": ["string_list_data.0.timestamp", "title"],
+    }
+    assert stream_of({"extraction_function": compile_spec(LIST_SPEC)}) is None
+
+
+def test_only_records_under_a_key_are_streamed():
+    with pytest.raises(ValueError):
+        compile_spec({**COUNT_SPEC, "records": None, "stream": True})
+    with pytest.raises(ValueError):
+        compile_spec({**COUNT_SPEC, "records": "media.*.items", "stream": True})
@@ -0,0 +1,74 @@
+import zipfile
+
+from port import face_cache
+from port.face_cache import FaceCache, open_face_cache, take_unsynced
+
+PARAMS = {"detector": "haar", "minNeighbors": 5}
+
+
+def member(crc, size=100):
+    zip_info = zipfile.ZipInfo(f"media/{crc}.jpg")
+    zip_info.CRC = crc
+    zip_info.file_size = size
+    return zip_info
+
+
+def test_results_are_kept_between_uploads(tmp_path):
+    cache = FaceCache(str(tmp_path), PARAMS)
+    cache.put(member(1), "face_detected")
+    cache.save()
+
+    cache = FaceCache(str(tmp_path), PARAMS)
+    assert cache.get(member(1)) == "face_detected"
+    assert cache.get(member(1, size=101)) is None
+    assert cache.get(member(2)) is None
+
+
+def test_results_of_other_params_are_not_used(tmp_path):
+    cache = FaceCache(str(tmp_path), PARAMS)
+    cache.put(member(1), "face_detected")
+    cache.save()
+
+    cache = FaceCache(str(tmp_path), {**PARAMS, "minNeighbors": 3})
+    assert cache.get(member(1)) is None
+
+
+def test_least_recently_used_results_are_evicted(tmp_path):
+    cache = FaceCache(str(tmp_path), PARAMS, max_entries=2)
+    cache.put(member(1), "no_face_detected")
+    cache.put(member(2), "no_face_detected")
+    cache.put(member(1), "no_face_detected")
+    cache.put(member(3), "face_detected")
+
+    assert cache.get(member(2)) is None
+    assert cache.get(member(1)) == "no_face_detected"
+    assert cache.get(member(3)) == "face_detected"
+
+
+def test_unreadable_cache_starts_empty(tmp_path):
+    (tmp_path / "faces.json").write_text("{not json")
+
+    assert FaceCache(str(tmp_path), PARAMS).entries == {}
+
+
+def test_saved_caches_are_synced_once(tmp_path):
+    take_unsynced()
+    cache = FaceCache(str(tmp_path), PARAMS)
+
+    cache.save()
+    assert not take_unsynced()
+
+    cache.put(member(1), "face_detected")
+    cache.save()
+    assert take_unsynced()
+    assert not take_unsynced()
+
+
+def test_native_cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(face_cache, "browser_cache_dir", str(tmp_path / "missing"))
+
+    monkeypatch.setenv("PORT_FACE_CACHE_DIR", str(tmp_path))
+    assert open_face_cache(PARAMS).directory == str(tmp_path)
+
+    monkeypatch.setenv("PORT_FACE_CACHE_DIR", "")
+    assert open_face_cache(PARAMS) is None
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from port.face_detectors import CascadeDetector, get_face_detector
+
+
+class CountingDetector(CascadeDetector):
+    """CascadeDetector counting its full passes"""
+
+    full_passes = 0
+
+    def detect_with(self, img_gray, scale_factor):
+        self.full_passes += 1
+        return super().detect_with(img_gray, scale_factor)
+
+
+def test_coarse_pass_without_a_face_is_not_final():
+    detector = CountingDetector("haar_early", coarse_scale_factor=1.3)
+    blank = np.full((200, 200), 128, dtype=np.uint8)
+
+    assert not detector.detect(blank)
+    assert detector.full_passes == 1
+
+
+def test_early_exit_agrees_with_the_full_pass():
+    rng = np.random.default_rng(0)
+    pictures = [
+        cv2.GaussianBlur(rng.integers(0, 256, (150, 200), dtype=np.uint8), (0, 0), s)
+        for s in (0.5, 2, 6)
+    ]
+
+    haar = get_face_detector("haar")
+    haar_early = get_face_detector("haar_early")
+
+    assert [haar_early.detect(p) for p in pictures] == [
+        haar.detect(p) for p in pictures
+    ]
+
+
+def test_results_of_the_early_exit_are_cached_apart():
+    assert get_face_detector("haar_early").params != get_face_detector("haar").params
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from port.image_hash import DuplicatePictures, dhash
+
+
+def picture(width=90, height=80):
+    # blocks of the 9 x 8 thumbnail with clearly different brightness
+    blocks = np.random.default_rng(0).permutation(72).reshape(8, 9) * 3 + 20
+    return cv2.resize(
+        blocks.astype(np.uint8), (width, height), interpolation=cv2.INTER_NEAREST
+    )
+
+
+def test_re_encoded_copies_get_the_same_hash():
+    img = picture()
+    _, encoded = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 60])
+    copy = cv2.imdecode(encoded, cv2.IMREAD_GRAYSCALE)
+
+    assert dhash(copy) == dhash(img)
+
+
+def test_rescaled_copies_get_the_same_hash():
+    img = picture(180, 160)
+    copy = cv2.resize(img, (135, 120), interpolation=cv2.INTER_AREA)
+
+    assert dhash(copy) == dhash(img)
+    assert dhash(picture(90, 80)) == dhash(img)
+
+
+def test_other_pictures_get_another_hash():
+    img = picture()
+
+    assert dhash(np.fliplr(img).copy()) != dhash(img)
+    assert dhash(255 - img) != dhash(img)
+
+
+def test_duplicate_pictures():
+    duplicates = DuplicatePictures()
+    key = dhash(picture())
+
+    assert duplicates.get(key) is None
+    duplicates.put(key, "face_detected")
+    duplicates.put(key, "no_face_detected")
+
+    assert duplicates.get(key) == "face_detected"
+    assert duplicates.hits == 1
+    assert duplicates.hit_rate == 0.5
@@ -0,0 +1,91 @@
+import io
+import json
+
+import pytest
+
+from port.json_stream import compile_projection, iter_projected, iter_records, project
+
+RECORDS = [
+    {"string_map_data": {"Time": {"timestamp": 1672531200 + i}}, "title": f"t{i}"}
+    for i in range(20)
+]
+
+CONTENT = {
+    "other": {"text": 'braces { [ and "quotes" \\" in strings'},
+    "impressions": RECORDS,
+}
+
+
+def stream(content):
+    return io.BytesIO(json.dumps(content).encode("utf-8"))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_records_across_chunks(chunk_size):
+    text_file = io.StringIO(json.dumps(CONTENT))
+    assert list(iter_records(text_file, "impressions", chunk_size)) == RECORDS
+
+
+def test_number_cut_at_the_end_of_a_chunk():
+    text_file = io.StringIO("[1.5e3, 12345, -0.25]")
+    assert list(iter_records(text_file, chunk_size=3)) == [1500.0, 12345, -0.25]
+
+
+def test_projection_keeps_only_the_fields():
+    records = iter_projected(
+        stream(CONTENT), "impressions", ["string_map_data.Time.timestamp"], 16
+    )
+    assert list(records) == [
+        {
+            "string_map_data": {
+                "Time": {"timestamp": r["string_map_data"]["Time"]["timestamp"]}
+            }
+        }
+        for r in RECORDS
+    ]
+
+
+def test_projection_keeps_list_positions():
+    paths = compile_projection(["string_list_data.1.timestamp"])
+    value = {"string_list_data": [{"timestamp": 1}, {"timestamp": 2}, {"timestamp": 3}]}
+
+    assert project(value, paths) == {"string_list_data": [None, {"timestamp": 2}]}
+
+
+def test_single_record_file():
+    assert list(
+        iter_projected(stream({"title": "x", "other": 1}), None, ["title"])
+    ) == [{"title": "x"}]
+
+
+def test_records_are_decoded_lazily():
+    records = iter_projected(stream(CONTENT), "impressions", ["title"], 16)
+    assert next(records) == {"title": "t0"}
+    assert next(records) == {"title": "t1"}
+
+
+def test_truncated_file_yields_the_complete_records_then_fails():
+    text = json.dumps(CONTENT)
+    cut = text.index('"t5"')
+
+    records = iter_projected(
+        io.BytesIO(text[:cut].encode("utf-8")), "impressions", ["title"], 16
+    )
+
+    received = []
+    with pytest.raises(json.JSONDecodeError):
+        for record in records:
+            received.append(record)
+
+    assert received == [{"title": f"t{i}"} for i in range(5)]
+
+
+def test_truncated_skipped_value_fails():
+    text = '{"other": {"a": [1, 2'
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_projected(io.BytesIO(text.encode("utf-8")), "impressions"))
+
+
+def test_missing_records_key():
+    with pytest.raises(KeyError):
+        list(iter_projected(stream({"other": []}), "impressions"))
@@ -0,0 +1,54 @@
+from port.pipeline import ExtractionGraph
+
+ROUTES = ["ads.json", "posts.json", "liked.json", "stories.json", "reels.json"]
+NEEDS = {
+    "posts.json": ["media/1.jpg", "media/2.jpg"],
+    "stories.json": ["media/2.jpg"],
+    "reels.json": [],
+}
+
+
+def test_files_without_pictures_are_independent_in_order():
+    graph = ExtractionGraph(ROUTES, NEEDS)
+
+    assert graph.take_independent(1) == [(0, "ads.json")]
+    assert graph.take_independent() == [(2, "liked.json")]
+    assert graph.take_independent() == []
+
+
+def test_files_without_referenced_pictures_are_ready():
+    graph = ExtractionGraph(ROUTES, NEEDS)
+
+    assert graph.take_ready() == [(4, "reels.json")]
+    assert graph.take_ready() == []
+
+
+def test_files_become_ready_when_all_their_pictures_are_done():
+    graph = ExtractionGraph(ROUTES, NEEDS)
+    graph.take_ready()
+
+    graph.picture_done("media/1.jpg")
+    assert graph.take_ready() == []
+
+    graph.picture_done("media/2.jpg")
+    assert graph.take_ready() == [(1, "posts.json"), (3, "stories.json")]
+    assert graph.missing == {}
+
+    # unreferenced and repeated pictures change nothing
+    graph.picture_done("media/3.jpg")
+    graph.picture_done("media/2.jpg")
+    assert graph.take_ready() == []
+
+
+def test_remaining_files_in_order():
+    graph = ExtractionGraph(ROUTES, NEEDS)
+    graph.take_independent(1)
+    graph.picture_done("media/2.jpg")
+
+    assert graph.take_remaining() == [
+        (1, "posts.json"),
+        (2, "liked.json"),
+        (3, "stories.json"),
+        (4, "reels.json"),
+    ]
+    assert graph.take_remaining() == []
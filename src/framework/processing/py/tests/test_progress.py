@@ -0,0 +1,61 @@
+from port.progress import coalesce_progress
+
+
+class FakeClock:
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def updates(count):
+    return [(f"step {i}", i * 100 // (count - 1)) for i in range(count)]
+
+
+def test_updates_are_limited_per_second():
+    passed = list(
+        coalesce_progress(updates(101), max_per_second=4, clock=FakeClock(0.01))
+    )
+
+    # 1 s of updates: the first and one every 0.25 s
+    assert passed[0] == ("step 0", 0)
+    assert 4 <= len(passed) <= 6
+
+
+def test_final_update_is_always_passed_on():
+    passed = list(
+        coalesce_progress(updates(11), max_per_second=1, clock=FakeClock(0.01))
+    )
+
+    assert passed == [("step 0", 0), ("step 10", 100)]
+
+
+def test_final_update_is_not_repeated():
+    passed = list(coalesce_progress(updates(3), max_per_second=1, clock=FakeClock(2)))
+
+    assert passed == updates(3)
+
+
+def test_min_step():
+    passed = list(coalesce_progress(updates(101), min_step=25, clock=FakeClock(1)))
+
+    assert [percentage for _, percentage in passed] == [0, 25, 50, 75, 100]
+
+
+def test_updates_are_consumed_in_order():
+    consumed = []
+
+    def work():
+        for update in updates(5):
+            consumed.append(update)
+            yield update
+
+    passed = coalesce_progress(work(), max_per_second=1, clock=FakeClock(0.01))
+
+    assert next(passed) == ("step 0", 0)
+    assert consumed == updates(5)[:1]
+    assert list(passed) == [("step 4", 100)]
+    assert consumed == updates(5)
@@ -0,0 +1,61 @@
+from port.routing import compile_routes
+
+
+def test_key_matches_the_last_path_segments():
+    members = [
+        "connections/followers_and_following/following.json",
+        "your_instagram_activity/comments/reels_comments.json",
+        "media/posts/picture.jpg",
+    ]
+
+    plan = compile_routes(
+        {"followers_and_following/following": {}, "reels": {}}, members
+    )
+
+    assert plan.routes["followers_and_following/following"] == members[0]
+    # "reels" is not a suffix of "reels_comments"
+    assert plan.routes["reels"] is None
+    assert plan.unmatched == ["reels"]
+
+
+def test_json_extension_in_the_key_is_ignored():
+    members = ["personal_information/personal_information/personal_information.json"]
+
+    plan = compile_routes(
+        {"personal_information/personal_information.json": {}}, members
+    )
+
+    assert plan.routes["personal_information/personal_information.json"] == members[0]
+
+
+def test_most_specific_key_claims_a_member():
+    members = [
+        "your_instagram_activity/content/reels.json",
+        "your_instagram_activity/other/reels.json",
+    ]
+
+    plan = compile_routes({"reels": {}, "content/reels": {}}, members)
+
+    assert plan.routes["content/reels"] == members[0]
+    assert plan.routes["reels"] == members[1]
+    assert plan.ambiguous == {}
+
+
+def test_ambiguous_key_uses_the_first_member():
+    members = [
+        "a/followers_1.json",
+        "b/followers_1.json",
+    ]
+
+    plan = compile_routes({"followers_1": {}}, members)
+
+    assert plan.routes["followers_1"] == members[0]
+    assert plan.ambiguous == {"followers_1": members}
+
+
+def test_routes_keep_the_order_of_the_keys():
+    members = ["x/b.json", "x/a.json"]
+
+    plan = compile_routes({"a": {}, "missing": {}, "b": {}}, members)
+
+    assert list(plan.routes) == ["a", "missing", "b"]
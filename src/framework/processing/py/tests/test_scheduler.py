@@ -0,0 +1,77 @@
+import pytest
+
+from port import scheduler
+from port.scheduler import FaceScanSchedule, TimeBudget
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler.time, "monotonic", clock)
+    return clock
+
+
+def scan(schedule, clock, seconds_per_picture):
+    analyzed = []
+    for _ in range(schedule.picture_count):
+        analyze = schedule.analyze()
+        analyzed.append(analyze)
+        if analyze:
+            clock.now += seconds_per_picture
+            schedule.picture_finished()
+    return analyzed
+
+
+def test_all_pictures_are_analyzed_if_they_fit(clock):
+    schedule = FaceScanSchedule(clock.now + 10, 10)
+
+    assert all(scan(schedule, clock, 0.5))
+    assert schedule.not_analyzed == 0
+
+
+def test_share_that_fits_is_analyzed(clock):
+    schedule = FaceScanSchedule(clock.now + 10, 40)
+
+    analyzed = scan(schedule, clock, 0.5)
+
+    assert clock.now <= schedule.deadline + 0.5
+    assert 15 <= sum(analyzed) <= 21
+    assert schedule.sampled_out + schedule.skipped == analyzed.count(False)
+    # spread over the pictures, not only the first ones
+    assert any(analyzed[30:])
+
+
+def test_no_pictures_after_the_deadline(clock):
+    schedule = FaceScanSchedule(clock.now + 1, 5)
+    clock.now += 2
+
+    assert scan(schedule, clock, 0.1) == [False] * 5
+    assert schedule.skipped == 5
+
+
+def test_face_scan_gets_the_time_not_reserved(clock):
+    budget = TimeBudget(seconds=60, start=clock.now)
+
+    assert budget.face_schedule(10, reserve=20).deadline == 140
+
+
+def test_other_work_is_not_counted_per_picture(clock):
+    schedule = FaceScanSchedule(clock.now + 10, 10)
+    assert schedule.analyze()
+    clock.now += 0.5
+    schedule.picture_finished()
+
+    # an extraction of 4 s in between, whose 4 s reserve is released
+    clock.now += 4
+    schedule.other_work_done(4, reserved=4)
+
+    assert schedule.deadline == 114
+    assert all(scan(schedule, clock, 0.5)[:9])
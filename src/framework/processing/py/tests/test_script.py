@@ -0,0 +1,207 @@
+import io
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+# the face scan needs OpenCV and Pillow, which Pyodide provides
+pytest.importorskip("cv2")
+Image = pytest.importorskip("PIL.Image")
+
+from port import script
+from port.extraction_functions_dict import extraction_dict
+from port.face_detectors import FaceDetector
+from port.image_hash import DuplicatePictures
+from port.profile import StudyProfile
+from port.scheduler import TimeBudget
+from port.zip_index import ZipIndex
+
+DAY = 1_700_000_000
+
+# pictures with (bright) and without (dark) a face for BrightDetector
+PICTURES = {
+    "media/posts/202311/p0.jpg": 220,
+    "media/posts/202311/p1.jpg": 30,
+    "media/posts/202311/p2.jpg": 200,
+    "media/stories/202311/s0.jpg": 40,
+    "media/stories/202311/s1.jpg": 230,
+    "media/other/pp.jpg": 210,
+}
+
+PICTURE_EXTRACTORS = ["posts_1", "stories", "profile_photos"]
+
+
+@dataclass
+class BrightDetector(FaceDetector):
+    """stands in for a face detector: bright pictures have a face"""
+
+    name: str = "bright"
+
+    def detect(self, img_gray):
+        return bool(img_gray.mean() > 127)
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    monkeypatch.setattr(script, "get_face_detector", lambda name=None: BrightDetector())
+
+
+def jpg(brightness):
+    # textured, so every picture has its own perceptual hash
+    noise = np.random.default_rng(brightness).integers(-20, 20, (48, 64))
+    pixels = np.clip(brightness + noise, 0, 255).astype(np.uint8)
+
+    file = io.BytesIO()
+    Image.fromarray(pixels).save(file, "JPEG")
+    return file.getvalue()
+
+
+@pytest.fixture
+def ddp(make_zip):
+    posts = [
+        {"media": [{"uri": uri, "creation_timestamp": DAY + i * 86400}]}
+        for i, uri in enumerate(list(PICTURES)[:3])
+    ]
+    posts.append(
+        {"media": [{"uri": "media/posts/202311/v.mp4", "creation_timestamp": DAY}]}
+    )
+    stories = [
+        {"uri": uri, "creation_timestamp": DAY + i * 3600}
+        for i, uri in enumerate(list(PICTURES)[3:5])
+    ]
+    likes = [
+        {"title": "a", "string_list_data": [{"timestamp": DAY + i * 40000}]}
+        for i in range(10)
+    ]
+
+    members = {
+        "ads_information/ads_and_topics/ads_clicked.json": {
+            "impressions_history_ads_clicked": likes
+        },
+        "your_instagram_activity/content/posts_1.json": posts,
+        "your_instagram_activity/content/stories.json": {"ig_stories": stories},
+        "your_instagram_activity/content/profile_photos.json": {
+            "ig_profile_picture": [{"uri": "media/other/pp.jpg"}]
+        },
+        "your_instagram_activity/likes/liked_posts.json": {"likes_media_likes": likes},
+        "media/posts/202311/v.mp4": b"\0" * 100,
+    }
+    members.update({uri: jpg(brightness) for uri, brightness in PICTURES.items()})
+    return make_zip(members)
+
+
+def extract(path, profile, **kwargs):
+    """the extracted tables by key of extraction_dict"""
+    with ZipIndex(path) as zip_index:
+        for _, _, data in script.extract_data(zip_index, "en", profile, **kwargs):
+            pass
+    return dict(zip(profile.select(extraction_dict), data))
+
+
+def face_column(tables):
+    return {
+        key: tables[key].values("Face visible").tolist() for key in PICTURE_EXTRACTORS
+    }
+
+
+def test_pictures_are_analyzed(ddp, detector):
+    tables = extract(ddp, StudyProfile())
+
+    assert face_column(tables) == {
+        "posts_1": ["Yes", "No", "Yes", "Not analyzed"],
+        "stories": ["No", "Yes"],
+        "profile_photos": ["Yes"],
+    }
+
+
+def test_pictures_are_not_analyzed_without_image_analysis(ddp, detector):
+    tables = extract(ddp, StudyProfile(analyze_images=False))
+
+    assert face_column(tables) == {
+        "posts_1": ["Not analyzed"] * 4,
+        "stories": ["Not analyzed"] * 2,
+        "profile_photos": ["Not analyzed"],
+    }
+    assert (
+        tables["liked_posts"].to_json()
+        == extract(ddp, StudyProfile())["liked_posts"].to_json()
+    )
+
+
+def as_json(tables):
+    return {key: table.to_json() for key, table in tables.items()}
+
+
+@pytest.mark.parametrize(
+    "mode", ["face threads", "duplicates", "thread pool", "process pool"]
+)
+def test_executor_modes_extract_the_same_tables(ddp, detector, mode):
+    profile = StudyProfile()
+    inline = as_json(extract(ddp, profile))
+
+    if mode == "face threads":
+        tables = extract(ddp, profile, face_workers=2)
+    elif mode == "duplicates":
+        tables = extract(ddp, profile, face_duplicates=DuplicatePictures())
+    else:
+        pool = ThreadPoolExecutor if mode == "thread pool" else ProcessPoolExecutor
+        with pool(max_workers=2) as executor:
+            tables = extract(ddp, profile, executor=executor, face_workers=2)
+
+    assert as_json(tables) == inline
+
+
+def test_extracted_tables(ddp, detector):
+    tables = extract(ddp, StudyProfile())
+
+    # every selected extractor has a table, the missing files say so
+    assert len(tables) == len(extraction_dict)
+    assert tables["close_friends"].titles == ["No information"]
+
+    liked = tables["liked_posts"]
+    assert liked.values("Date").astype(str).tolist()[:2] == ["2023-11-14", "2023-11-15"]
+    assert sum(liked.values(liked.titles[1]).tolist()) == 10
+
+    assert tables["ads_clicked"].values("Clicked ad").tolist()[0][:1] == ["a"]
+
+
+def test_pictures_are_not_analyzed_after_the_time_budget(ddp, detector):
+    time_budget = TimeBudget(seconds=0)
+
+    tables = extract(ddp, StudyProfile(), time_budget=time_budget)
+
+    assert face_column(tables) == {
+        "posts_1": ["Not analyzed"] * 4,
+        "stories": ["Not analyzed"] * 2,
+        "profile_photos": ["Not analyzed"],
+    }
+    assert time_budget.notes
+    assert (
+        as_json(tables)["liked_posts"]
+        == as_json(extract(ddp, StudyProfile()))["liked_posts"]
+    )
+
+
+class Payload:
+    def __init__(self, type, value=None):
+        self.__type__ = type
+        self.value = value
+
+
+def test_process_renders_the_consent_form(ddp, detector, monkeypatch):
+    monkeypatch.setenv("PORT_FACE_CACHE_DIR", "")
+
+    session = script.process(1, "en", {"analyze_images": False})
+    command = session.send(None)
+    command = session.send(Payload("PayloadString", ddp))
+    while type(command.page.body).__name__ == "PropsUIPromptProgress":
+        command = session.send(Payload("PayloadTrue", True))
+
+    consent = command.page.body
+    assert type(consent).__name__ == "PropsUIPromptConsentForm"
+
+    tables = {table.id: table.toDict()["data_frame"] for table in consent.tables}
+    assert tables["posts_1"].count("Not analyzed") == 4
+    # single row tables like the profile photo are shown in the overview
+    assert "Face visible: Not analyzed" in tables["binary_results"]
@@ -0,0 +1,77 @@
+import json
+
+import numpy as np
+import pytest
+
+from port.api.table import DictionaryColumn, Table, as_table
+
+pd = pytest.importorskip("pandas")
+
+COLUMNS = {
+    "ints": np.array([1, 2, 3]),
+    "floats": np.array([0.1, np.nan, 1 / 3]),
+    "strings": ["a/b", "über", 'say "hi"'],
+    "lists": [["x", "y"], [], ["z"]],
+    "days": np.array(["2023-01-02", "NaT", "1999-12-31"], dtype="datetime64[D]"),
+    "objects": [1.5, None, "c"],
+}
+
+
+def test_to_json_like_pandas():
+    table = Table(COLUMNS)
+
+    assert table.to_json() == pd.DataFrame(COLUMNS).to_json()
+
+
+def test_dictionary_column_to_json_like_pandas():
+    values = ["Yes", "No", "No", "Yes"]
+    table = Table(
+        {
+            "encoded": DictionaryColumn.encode(values),
+            "flags": DictionaryColumn.from_flags(
+                [True, False, False, True], "No", "Yes"
+            ),
+        }
+    )
+
+    assert (
+        table.to_json() == pd.DataFrame({"encoded": values, "flags": values}).to_json()
+    )
+
+
+def test_scalars_are_repeated():
+    table = Table({"a": [1, 2], "b": "x"})
+
+    assert table.to_json() == pd.DataFrame({"a": [1, 2], "b": "x"}).to_json()
+    assert table.row(1) == {"a": 2, "b": "x"}
+
+
+def test_empty_table():
+    assert Table().to_json() == pd.DataFrame().to_json()
+    assert len(Table()) == 0
+
+
+def test_unequal_lengths():
+    with pytest.raises(ValueError):
+        Table({"a": [1, 2], "b": [1]})
+
+
+def test_group_list_like_pandas():
+    columns = {"key": ["b", "a", "b", "c", "a"], "value": [1, 2, 3, 4, 5]}
+    grouped = Table(columns).group_list("key", "value")
+
+    expected = pd.DataFrame(columns).groupby("key")["value"].agg(list).reset_index()
+    assert grouped.to_json() == expected.to_json()
+    assert json.loads(grouped.to_json())["value"] == {
+        "0": [2, 5],
+        "1": [1, 3],
+        "2": [4],
+    }
+
+
+def test_as_table_of_data_frame():
+    table = as_table(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+
+    assert table.titles == ["a", "b"]
+    assert table.to_json() == Table({"a": [1, 2], "b": ["x", "y"]}).to_json()
+    assert as_table(table) is table
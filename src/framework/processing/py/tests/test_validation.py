@@ -0,0 +1,50 @@
+from port.validation import check_ddp_file
+
+
+def test_json_ddp_is_valid_and_indexed(make_zip):
+    path = make_zip({"ads_information/ads_clicked.json": {}, "media/1.jpg": b"12"})
+
+    ddp_check, zip_index = check_ddp_file(path)
+
+    assert ddp_check.status == "valid"
+    assert ddp_check.member_count == 2
+    assert ddp_check.total_size == 4
+    assert zip_index.json_files == ["ads_information/ads_clicked.json"]
+    zip_index.close()
+
+
+def test_html_ddp(make_zip):
+    path = make_zip({"ads_information/ads.html": "", "start_here.html": ""})
+
+    ddp_check, zip_index = check_ddp_file(path)
+
+    assert ddp_check.status == "invalid_no_json"
+    assert zip_index is None
+
+
+def test_zip_file_without_ddp(make_zip):
+    ddp_check, zip_index = check_ddp_file(make_zip({"notes.txt": "x"}))
+
+    assert ddp_check.status == "invalid_no_ddp"
+    assert zip_index is None
+
+
+def test_no_zip_file(tmp_path):
+    path = tmp_path / "ddp.zip"
+    path.write_bytes(b"%PDF-1.4 not a zip file")
+
+    ddp_check, zip_index = check_ddp_file(str(path))
+
+    assert ddp_check.status == "invalid_file_zip"
+    assert zip_index is None
+
+
+def test_corrupt_zip_file(make_zip, tmp_path):
+    content = open(make_zip({"ads_information/a.json": {}}), "rb").read()
+    path = tmp_path / "truncated.zip"
+    path.write_bytes(content[: len(content) // 2])
+
+    ddp_check, zip_index = check_ddp_file(str(path))
+
+    assert ddp_check.status == "invalid_file_error"
+    assert zip_index is None
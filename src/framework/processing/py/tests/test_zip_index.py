@@ -0,0 +1,134 @@
+import pytest
+
+from port.profile import StudyProfile
+from port.zip_index import (
+    MiB,
+    DecompressionBudget,
+    DecompressionBudgetExceeded,
+    ZipIndex,
+    load_json_member,
+)
+
+
+def test_members_are_classified_once(make_zip):
+    path = make_zip(
+        {
+            "ads_information/ads_clicked.json": {"a": 1},
+            "media/posts/1.jpg": b"jpg",
+            "media/posts/2.JPG": b"jpg",
+            "start_here.html": "<html/>",
+        }
+    )
+
+    with ZipIndex(path) as zip_index:
+        assert zip_index.json_files == ["ads_information/ads_clicked.json"]
+        assert zip_index.media_images == ["media/posts/1.jpg", "media/posts/2.JPG"]
+        assert len(zip_index.members) == 4
+        assert zip_index.read_json("ads_information/ads_clicked.json") == {"a": 1}
+
+
+def test_streamed_json_is_read_while_iterating(make_zip):
+    records = [{"title": f"t{i}", "other": i} for i in range(10)]
+    path = make_zip({"a.json": {"records": records}})
+    stream = {"records": "records", "fields": ["title"]}
+
+    with ZipIndex(path) as zip_index:
+        content = zip_index.read_json("a.json", stream)
+        assert zip_index.budget.total_read == 0
+        assert list(content["records"]) == [{"title": r["title"]} for r in records]
+
+    content = load_json_member(path, "a.json", stream)
+    assert list(content["records"]) == [{"title": r["title"]} for r in records]
+
+
+def test_member_over_the_size_limit(make_zip):
+    path = make_zip({"big.json": b" " * (2 * MiB)})
+
+    with ZipIndex(path, DecompressionBudget(max_member_size=MiB)) as zip_index:
+        with pytest.raises(DecompressionBudgetExceeded):
+            zip_index.open("big.json")
+
+
+def test_member_over_the_ratio_limit(make_zip):
+    # zeros compress far better than 10:1
+    path = make_zip({"bomb.json": b"0" * (2 * MiB)})
+
+    with ZipIndex(path, DecompressionBudget(max_ratio=10)) as zip_index:
+        with pytest.raises(DecompressionBudgetExceeded):
+            zip_index.read_json("bomb.json")
+
+
+def test_small_members_are_not_rejected_for_their_ratio(make_zip):
+    path = make_zip({"small.json": "[" + "0," * 1000 + "0]"})
+
+    with ZipIndex(path, DecompressionBudget(max_ratio=2)) as zip_index:
+        assert len(zip_index.read_json("small.json")) == 1001
+
+
+def test_total_of_the_upload(make_zip):
+    content = [0] * 100
+    path = make_zip({"a.json": content, "b.json": content})
+    size = len("[" + ", ".join(["0"] * 100) + "]")
+
+    budget = DecompressionBudget(max_total_size=size + size // 2)
+    with ZipIndex(path, budget) as zip_index:
+        assert zip_index.read_json("a.json") == content
+        with pytest.raises(DecompressionBudgetExceeded):
+            zip_index.read_json("b.json")
+
+
+def test_streamed_pictures_do_not_count_toward_the_total(make_zip):
+    path = make_zip({"media/1.jpg": b"x" * 1000, "a.json": [1]})
+
+    budget = DecompressionBudget(max_total_size=100)
+    with ZipIndex(path, budget) as zip_index:
+        with zip_index.open("media/1.jpg", retained=False) as picture:
+            assert len(picture.read()) == 1000
+        assert budget.total_read == 0
+        assert zip_index.read_json("a.json") == [1]
+
+
+def test_streamed_json_has_its_own_size_limit(make_zip):
+    records = [{"title": "x" * 100}] * 100
+    path = make_zip({"a.json": {"records": records}})
+    stream = {"records": "records", "fields": ["title"]}
+
+    # larger than a member read at once may be, and not held in memory
+    budget = DecompressionBudget(max_member_size=1000, max_total_size=1000)
+    with ZipIndex(path, budget) as zip_index:
+        assert len(list(zip_index.read_json("a.json", stream)["records"])) == 100
+        assert budget.total_read == 0
+
+        with pytest.raises(DecompressionBudgetExceeded):
+            zip_index.read_json("a.json")
+
+    budget = DecompressionBudget(max_streamed_size=1000)
+    with ZipIndex(path, budget) as zip_index:
+        content = zip_index.read_json("a.json", stream)
+        # raised while iterating
+        with pytest.raises(DecompressionBudgetExceeded):
+            list(content["records"])
+
+    content = load_json_member(path, "a.json", stream, budget)
+    with pytest.raises(DecompressionBudgetExceeded):
+        list(content["records"])
+
+
+def test_defaults_fit_the_browser():
+    budget = DecompressionBudget()
+
+    assert budget.max_member_size <= 128 * MiB
+    assert budget.max_total_size <= 512 * MiB
+
+
+def test_profile_raises_the_limits():
+    profile = StudyProfile(
+        decompression_budget={"max_member_size": 512, "max_ratio": 500, "typo": 1}
+    )
+
+    budget = profile.budget()
+
+    assert budget.max_member_size == 512 * MiB
+    assert budget.max_ratio == 500
+    assert budget.max_total_size == DecompressionBudget().max_total_size
+    assert StudyProfile().budget() == DecompressionBudget()
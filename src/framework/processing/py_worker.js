@@ -34,6 +34,10 @@ onmessage = (event) => {
 function runCycle(payload) {
   console.log("[ProcessingWorker] runCycle " + JSON.stringify(payload));
   scriptEvent = pyScript.send(payload);
+  // the face cache is saved once after the face scan
+  if (self.pyodide.runPython("port.face_cache.take_unsynced()")) {
+    persistFaceCache();
+  }
   self.postMessage({
     eventType: "runCycleDone",
     scriptEvent: scriptEvent.toJs({
@@ -87,11 +91,57 @@ function initialise() {
       self.pyodide = pyodide;
       return loadPackages();
     })
+    .then(() => {
+      return mountFaceCache();
+    })
     .then(() => {
       return installPortPackage();
     });
 }
 
+// face detection results are kept in IndexedDB, so pictures of a DDP
+// that is uploaded again do not have to be analyzed again
+
+const faceCacheDirectory = "/face-cache";
+
+function mountFaceCache() {
+  console.log("[ProcessingWorker] mount face cache");
+  const FS = self.pyodide.FS;
+  FS.mkdir(faceCacheDirectory);
+  FS.mount(FS.filesystems.IDBFS, {}, faceCacheDirectory);
+  return new Promise((resolve) => {
+    FS.syncfs(true, (error) => {
+      if (error) {
+        console.log("[ProcessingWorker] face cache not loaded: ", error);
+      }
+      resolve();
+    });
+  });
+}
+
+let faceCacheSyncing = false;
+let faceCacheSyncAgain = false;
+
+function persistFaceCache() {
+  // syncs must not overlap, a save during a sync is persisted after it
+  if (faceCacheSyncing) {
+    faceCacheSyncAgain = true;
+    return;
+  }
+
+  faceCacheSyncing = true;
+  self.pyodide.FS.syncfs(false, (error) => {
+    if (error) {
+      console.log("[ProcessingWorker] face cache not saved: ", error);
+    }
+    faceCacheSyncing = false;
+    if (faceCacheSyncAgain) {
+      faceCacheSyncAgain = false;
+      persistFaceCache();
+    }
+  });
+}
+
 function startPyodide() {
   importScripts("https://cdn.jsdelivr.net/pyodide/v0.24.0/full/pyodide.js");
 
@@ -103,7 +153,7 @@ function startPyodide() {
 
 function loadPackages() {
   console.log("[ProcessingWorker] loading packages");
-  return self.pyodide.loadPackage(["micropip", "numpy", "pandas"]);
+  return self.pyodide.loadPackage(["micropip", "numpy"]);
 }
 
 function installPortPackage() {
@@ -270,6 +270,7 @@ export interface PropsUIButtonLabel {
   __type__: 'PropsUIButtonLabel'
   label: string
   color?: string
+  enabled?: boolean
   onClick: () => void
 }
 export function isPropsUIButtonLabel (arg: any): arg is PropsUIButtonLabel {
@@ -15,16 +15,36 @@ type Props = Weak<PropsUIPromptConsentForm> & ReactFactoryContext
 interface TableContext {
   title: string
   deletedRowCount: number
+  pending: boolean
 }
 
 export const ConsentForm = (props: Props): JSX.Element => {
   const tablesIn = React.useRef<Array<PropsUITable & TableContext>>(parseTables(props.tables))
   const metaTables = React.useRef<Array<PropsUITable & TableContext>>(parseTables(props.metaTables))
   const tablesOut = React.useRef<Array<PropsUITable & TableContext>>(tablesIn.current)
+  const tablesData = React.useRef<PropsUIPromptConsentFormTable[]>(props.tables)
+  const resolvedProps = React.useRef<Props>()
   const [waiting, setWaiting] = React.useState<boolean>(false)
 
   const { locale, resolve } = props
+  const complete = props.complete ?? true
   const cancelButton = Translator.translate(cancelButtonLabel, props.locale)
+  const pendingText = Translator.translate(pendingLabel, props.locale)
+
+  // Progressive rendering: the form is rendered again with more tables while they are extracted
+  if (tablesData.current !== props.tables) {
+    tablesData.current = props.tables
+    mergeTables(props.tables)
+  }
+
+  // The tables are not complete yet, resolve directly to give control back to script,
+  // once per rendered form (effects can run twice for the same props in StrictMode)
+  React.useEffect(() => {
+    if (!complete && resolvedProps.current !== props) {
+      resolvedProps.current = props
+      resolve?.({ __type__: 'PayloadTrue', value: true })
+    }
+  }, [props])
 
   function rowCell (dataFrame: any, column: string, row: number): PropsUITableCell {
     const text = String(dataFrame[column][`${row}`])
@@ -68,19 +88,44 @@ export const ConsentForm = (props: Props): JSX.Element => {
     return tablesData.map((table) => parseTable(table))
   }
 
+  function mergeTables (tablesData: PropsUIPromptConsentFormTable[]): void {
+    // Finished tables are kept with the changes made by the participant, the others are parsed
+    const merged = tablesData.map((tableData) => {
+      const tableIn = tablesIn.current.find((table) => table.id === tableData.id && !table.pending)
+      if (tableIn === undefined) {
+        const table = parseTable(tableData)
+        return [table, table]
+      }
+      const tableOut = tablesOut.current.find((table) => table.id === tableData.id) ?? tableIn
+      return [tableIn, tableOut]
+    })
+    tablesIn.current = merged.map(([tableIn]) => tableIn)
+    tablesOut.current = merged.map(([, tableOut]) => tableOut)
+  }
+
   function parseTable (tableData: PropsUIPromptConsentFormTable): (PropsUITable & TableContext) {
     const id = tableData.id
     const title = Translator.translate(tableData.title, props.locale)
     const deletedRowCount = 0
+    const pending = tableData.pending ?? false
     const dataFrame = JSON.parse(tableData.data_frame)
     const headCells = columnNames(dataFrame).map((column: string) => headCell(dataFrame, column))
     const head: PropsUITableHead = { __type__: 'PropsUITableHead', cells: headCells }
     const body: PropsUITableBody = { __type__: 'PropsUITableBody', rows: rows(dataFrame) }
 
-    return { __type__: 'PropsUITable', id, head, body, title, deletedRowCount }
+    return { __type__: 'PropsUITable', id, head, body, title, deletedRowCount, pending }
   }
 
   function renderTable (table: (Weak<PropsUITable> & TableContext), readOnly = false): JSX.Element {
+    if (table.pending) {
+      return (
+        <div key={table.id} className='flex flex-col gap-4 mb-4'>
+          <Title4 text={table.title} margin='' />
+          <BodyLarge text={pendingText} margin='' color='text-grey2' />
+        </div>
+      )
+    }
+
     return (
       <div key={table.id} className='flex flex-col gap-4 mb-4'>
         <Title4 text={table.title} margin='' />
@@ -93,21 +138,27 @@ export const ConsentForm = (props: Props): JSX.Element => {
     const tablesCopy = tablesOut.current.slice(0)
     const index = tablesCopy.findIndex(table => table.id === id)
     if (index > -1) {
-      const { title, head, body: oldBody, deletedRowCount: oldDeletedRowCount } = tablesCopy[index]
+      const { title, head, body: oldBody, deletedRowCount: oldDeletedRowCount, pending } = tablesCopy[index]
       const body: PropsUITableBody = { __type__: 'PropsUITableBody', rows }
       const deletedRowCount = oldDeletedRowCount + (oldBody.rows.length - rows.length)
-      tablesCopy[index] = { __type__: 'PropsUITable', id, head, body, title, deletedRowCount }
+      tablesCopy[index] = { __type__: 'PropsUITable', id, head, body, title, deletedRowCount, pending }
     }
     tablesOut.current = tablesCopy
   }
 
   function handleDonate (): void {
+    if (!complete) {
+      return
+    }
     setWaiting(true)
     const value = serializeConsentData()
     resolve?.({ __type__: 'PayloadJSON', value })
   }
 
   function handleCancel (): void {
+    if (!complete) {
+      return
+    }
     resolve?.({ __type__: 'PayloadFalse', value: false })
   }
 
@@ -159,9 +210,9 @@ export const ConsentForm = (props: Props): JSX.Element => {
           <div className='flex flex-row gap-4 mt-4 mb-4'>
             <PrimaryButton
               label={Translator.translate(props.donateButton ?? donateButtonLabel, locale)}
-              onClick={handleDonate} color='bg-success text-white' spinning={waiting}
+              onClick={handleDonate} color={complete ? 'bg-success text-white' : 'bg-grey3 text-white'} enabled={complete} spinning={waiting}
             />
-            <LabelButton label={cancelButton} onClick={handleCancel} color='text-grey1' />
+            <LabelButton label={cancelButton} onClick={handleCancel} color={complete ? 'text-grey1' : 'text-grey3'} enabled={complete} />
           </div>
         </div>
       </div>
@@ -179,6 +230,11 @@ const donateButtonLabel = new TextBundle()
   .add('de', 'Ja, spenden')
   .add('nl', 'Ja, doneer')
 
+const pendingLabel = new TextBundle()
+  .add('en', 'This data is still being extracted...')
+  .add('de', 'Diese Daten werden noch extrahiert...')
+  .add('nl', 'Deze gegevens worden nog geëxtraheerd...')
+
 const cancelButtonLabel = new TextBundle()
   .add('en', 'No')
   .add('de', 'Nein')